@@ -5,64 +5,79 @@ Handles environment variables, settings, and configuration loading.
 """
 
 import os
-from typing import Optional, Dict, Any
-from pathlib import Path
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Optional, Dict, Any, Mapping
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+_ENV_PREFIX = "MEMORY_"
+_TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "f", "no", "n", "off"})
 
 
-class MemoryMCPConfig(BaseSettings):
-    """Configuration settings for Memory MCP."""
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value."""
+    normalized = value.strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value: {value!r}")
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryMCPConfig:
+    """Configuration settings for Memory MCP.
     
-    model_config = SettingsConfigDict(
-        env_prefix="MEMORY_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False
-    )
+    Each field is read from the ``MEMORY_<FIELD_NAME>`` environment variable.
+    """
     
     # Server Configuration
-    host: str = Field(default="0.0.0.0", description="Server host address")
-    port: int = Field(default=8080, description="Server port number")
-    log_level: str = Field(default="INFO", description="Logging level")
+    host: str = field(default="0.0.0.0", metadata={"description": "Server host address"})
+    port: int = field(default=8080, metadata={"description": "Server port number"})
+    log_level: str = field(default="INFO", metadata={"description": "Logging level"})
     
     # Database Configuration
-    db_type: str = Field(default="sqlite", description="Database type")
-    db_path: str = Field(default="memory_graph.db", description="SQLite database path")
-    db_url: Optional[str] = Field(default=None, description="Database URL (for non-SQLite)")
-    db_user: Optional[str] = Field(default=None, description="Database username")
-    db_password: Optional[str] = Field(default=None, description="Database password")
+    db_type: str = field(default="sqlite", metadata={"description": "Database type"})
+    db_path: str = field(default="memory_graph.db", metadata={"description": "SQLite database path"})
+    db_url: Optional[str] = field(default=None, metadata={"description": "Database URL (for non-SQLite)"})
+    db_user: Optional[str] = field(default=None, metadata={"description": "Database username"})
+    db_password: Optional[str] = field(default=None, metadata={"description": "Database password"})
     
     # AI Configuration
-    ai_provider: str = Field(default="openai", description="AI provider (openai, anthropic, local)")
-    ai_api_key: Optional[str] = Field(default=None, description="AI provider API key")
-    ai_model: str = Field(default="gpt-3.5-turbo", description="AI model to use")
-    ai_embedding_model: str = Field(default="text-embedding-ada-002", description="Embedding model")
+    ai_provider: str = field(default="openai", metadata={"description": "AI provider (openai, anthropic, local)"})
+    ai_api_key: Optional[str] = field(default=None, metadata={"description": "AI provider API key"})
+    ai_model: str = field(default="gpt-3.5-turbo", metadata={"description": "AI model to use"})
+    ai_embedding_model: str = field(default="text-embedding-ada-002", metadata={"description": "Embedding model"})
     
     # Authentication
-    auth_enabled: bool = Field(default=False, description="Enable API authentication")
-    api_keys: Optional[str] = Field(default=None, description="Comma-separated API keys")
+    auth_enabled: bool = field(default=False, metadata={"description": "Enable API authentication"})
+    api_keys: Optional[str] = field(default=None, metadata={"description": "Comma-separated API keys"})
     
     # Gradio Configuration
-    gradio_host: str = Field(default="0.0.0.0", description="Gradio admin interface host")
-    gradio_port: int = Field(default=7860, description="Gradio admin interface port")
-    gradio_share: bool = Field(default=False, description="Enable Gradio sharing")
+    gradio_host: str = field(default="0.0.0.0", metadata={"description": "Gradio admin interface host"})
+    gradio_port: int = field(default=7860, metadata={"description": "Gradio admin interface port"})
+    gradio_share: bool = field(default=False, metadata={"description": "Enable Gradio sharing"})
     
     # Background Processing
-    dreamer_enabled: bool = Field(default=True, description="Enable background Dreamer AI")
-    dreamer_interval: int = Field(default=300, description="Dreamer processing interval in seconds")
-    max_connections: int = Field(default=10, description="Maximum concurrent connections")
+    dreamer_enabled: bool = field(default=True, metadata={"description": "Enable background Dreamer AI"})
+    dreamer_interval: int = field(default=300, metadata={"description": "Dreamer processing interval in seconds"})
+    max_connections: int = field(default=10, metadata={"description": "Maximum concurrent connections"})
     
     # Performance Settings
-    memory_cache_size: int = Field(default=1000, description="Memory cache size")
-    query_timeout: int = Field(default=30, description="Query timeout in seconds")
+    memory_cache_size: int = field(default=1000, metadata={"description": "Memory cache size"})
+    query_timeout: int = field(default=30, metadata={"description": "Query timeout in seconds"})
+    
+    # Parsed form of api_keys, computed once at construction
+    _api_key_list: tuple[str, ...] = field(init=False, repr=False, compare=False)
     
-    def get_api_keys(self) -> list[str]:
-        """Get list of valid API keys."""
-        if not self.api_keys:
-            return []
-        return [key.strip() for key in self.api_keys.split(",") if key.strip()]
+    def __post_init__(self):
+        """Parse the comma-separated API keys once."""
+        keys = self.api_keys.split(",") if self.api_keys else ()
+        object.__setattr__(self, "_api_key_list", tuple(key.strip() for key in keys if key.strip()))
+    
+    def get_api_keys(self) -> tuple[str, ...]:
+        """Get the valid API keys."""
+        return self._api_key_list
     
     def get_database_config(self) -> Dict[str, Any]:
         """Get database configuration."""
@@ -82,39 +97,30 @@ class MemoryMCPConfig(BaseSettings):
             "model": self.ai_model,
             "embedding_model": self.ai_embedding_model
         }
-
-
-def load_config() -> MemoryMCPConfig:
-    """Load configuration from environment and files."""
-    
-    # Look for .env file in current directory and parent directories
-    env_file = None
-    current_dir = Path.cwd()
-    
-    for dir_path in [current_dir] + list(current_dir.parents):
-        env_path = dir_path / ".env"
-        if env_path.exists():
-            env_file = str(env_path)
-            break
     
-    # Create config with discovered .env file
-    if env_file:
-        config = MemoryMCPConfig(_env_file=env_file)
-    else:
-        config = MemoryMCPConfig()
-    
-    return config
+    @classmethod
+    def from_environment(cls, environ: Mapping[str, str]) -> "MemoryMCPConfig":
+        """Build a configuration from a mapping of upper-cased variable names."""
+        parsers = {int: int, bool: _parse_bool}
+        values = {}
+        for config_field in fields(cls):
+            if not config_field.init:
+                continue
+            raw_value = environ.get(_ENV_PREFIX + config_field.name.upper())
+            if raw_value is not None:
+                values[config_field.name] = parsers.get(config_field.type, str)(raw_value)
+        return cls(**values)
 
 
-def create_sample_env_file(path: str = ".env.example") -> None:
-    """Create a sample environment file with all configuration options."""
-    
-    sample_content = """# Memory MCP Configuration
+# Pre-encoded contents of the sample environment file
+SAMPLE_ENV = b"""# Memory MCP Configuration
 
 # Server Configuration
 MEMORY_HOST=0.0.0.0
 MEMORY_PORT=8080
 MEMORY_LOG_LEVEL=INFO
+# Render stack_info in MCP server logs
+MEMORY_DEBUG=false
 
 # Database Configuration (SQLite by default)
 MEMORY_DB_TYPE=sqlite
@@ -148,9 +154,47 @@ MEMORY_MAX_CONNECTIONS=10
 MEMORY_CACHE_SIZE=1000
 MEMORY_QUERY_TIMEOUT=30
 """
+
+
+@lru_cache(maxsize=1)
+def load_config() -> MemoryMCPConfig:
+    """Load configuration from environment and files.
+    
+    The result is cached; call ``load_config.cache_clear()`` to force a reload.
+    """
+    
+    # Look for .env file in current directory and parent directories
+    env_file = None
+    current_dir = os.getcwd()
+    
+    while True:
+        env_path = os.path.join(current_dir, ".env")
+        if os.path.isfile(env_path):
+            env_file = env_path
+            break
+        parent_dir = os.path.dirname(current_dir)
+        if parent_dir == current_dir:
+            break
+        current_dir = parent_dir
+    
+    # Variables from the .env file, overridden by the process environment
+    environ = {}
+    if env_file:
+        from dotenv import dotenv_values
+        
+        environ.update(
+            (key.upper(), value) for key, value in dotenv_values(env_file).items() if value is not None
+        )
+    environ.update((key.upper(), value) for key, value in os.environ.items())
+    
+    return MemoryMCPConfig.from_environment(environ)
+
+
+def create_sample_env_file(path: str = ".env.example") -> None:
+    """Create a sample environment file with all configuration options."""
     
-    with open(path, "w") as f:
-        f.write(sample_content)
+    with open(path, "wb") as f:
+        f.write(SAMPLE_ENV)
     
     print(f"Sample configuration file created: {path}")
     print("Copy this to .env and customize your settings.")
@@ -6,17 +6,26 @@ between memories and creates summaries for improved knowledge organization.
 """
 
 import asyncio
+import itertools
 import random
 import time
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set
 
+import numpy as np
 import structlog
 
 from memory_core import MemoryCore, MemoryNode, MemoryRelationship
 
 logger = structlog.get_logger()
 
+# Shared default for memories without context; never mutated
+_EMPTY_CONTEXT: Dict[str, Any] = {}
+
+# Relationship scores above this create a relationship; pairs whose content Jaccard
+# similarity alone exceeds it are tried before random pairs
+_RELATIONSHIP_THRESHOLD = 0.3
 
 class DreamerAI:
     """Background AI worker for memory relationship discovery and summarization."""
@@ -71,34 +80,69 @@ class DreamerAI:
             self.logger.info("Not enough memories for relationship discovery", count=memory_count)
             return
         
-        # Perform different types of processing
-        await self._discover_relationships()
-        await self._create_summaries()
-        await self._update_priorities()
+        # Load candidate memories once and share them between the processing phases
+        snapshot = await self.memory_core.list_recent(limit=100)
+        
+        # The processing phases are independent, so run them concurrently and
+        # let one phase fail without aborting the others
+        phases = ("discover_relationships", "create_summaries", "update_priorities")
+        results = await asyncio.gather(
+            self._discover_relationships(snapshot[:50]),
+            self._create_summaries(snapshot),
+            self._update_priorities(),
+            return_exceptions=True
+        )
+        
+        for phase, result in zip(phases, results):
+            if isinstance(result, Exception):
+                self.logger.error("Dreamer AI phase failed", phase=phase, error=str(result))
         
         self.logger.info("Completed Dreamer AI processing cycle")
     
-    async def _discover_relationships(self):
-        """Discover and create relationships between memory pairs."""
+    async def _discover_relationships(self, sample_memories: List[Dict[str, Any]]):
+        """Discover and create relationships between pairs of the sampled memories."""
         self.logger.info("Discovering memory relationships")
         
-        # Get a sample of memories to analyze
-        sample_memories = await self.memory_core.query_memories("", limit=50)
-        
         if len(sample_memories) < 2:
             return
         
-        # Randomly sample pairs for relationship analysis
-        num_pairs = min(10, len(sample_memories) * (len(sample_memories) - 1) // 2)
-        
-        for _ in range(num_pairs):
-            # Pick two random memories
-            memory1, memory2 = random.sample(sample_memories, 2)
+        # Tokenize each memory once per cycle and score content similarity
+        # for every pair in a single matrix operation
+        token_cache = [self._tokenize(memory["content"]) for memory in sample_memories]
+        content_similarity = self._jaccard_matrix(token_cache)
+        
+        # Parse creation times once and flag every pair created within 24 hours
+        created = self._timestamp_column(sample_memories)
+        temporal_proximity = np.abs(created[:, None] - created[None, :]) < 86400
+        
+        # Canonical (key, value) items per context so matching entries are a set intersection
+        context_items = [self._context_items(memory) for memory in sample_memories]
+        
+        # Spend the pair budget on likely content matches first, then top up
+        # with random distinct pairs so context and temporal links are still explored
+        all_pairs = list(itertools.combinations(range(len(sample_memories)), 2))
+        num_pairs = min(10, len(all_pairs))
+        
+        candidate_pairs = [
+            (int(i), int(j)) for i, j in np.argwhere(np.triu(content_similarity > _RELATIONSHIP_THRESHOLD, 1))
+        ]
+        pairs = random.sample(candidate_pairs, min(num_pairs, len(candidate_pairs)))
+        if len(pairs) < num_pairs:
+            candidates = set(candidate_pairs)
+            remaining = [pair for pair in all_pairs if pair not in candidates]
+            pairs.extend(random.sample(remaining, num_pairs - len(pairs)))
+        
+        for i, j in pairs:
+            memory1, memory2 = sample_memories[i], sample_memories[j]
             
             # Analyze relationship
-            relationship_score = await self._analyze_relationship(memory1, memory2)
+            relationship_score = await self._analyze_relationship(
+                len(context_items[i] & context_items[j]),
+                float(content_similarity[i, j]),
+                bool(temporal_proximity[i, j])
+            )
             
-            if relationship_score > 0.3:  # Threshold for creating relationship
+            if relationship_score > _RELATIONSHIP_THRESHOLD:
                 relationship_type = self._classify_relationship(memory1, memory2)
                 
                 # This would typically store the relationship in the database
@@ -111,51 +155,87 @@ class DreamerAI:
                     type=relationship_type
                 )
     
-    async def _analyze_relationship(self, memory1: Dict[str, Any], memory2: Dict[str, Any]) -> float:
-        """Analyze the relationship strength between two memories."""
+    @staticmethod
+    def _tokenize(content: str) -> frozenset:
+        """Split content into a set of lowercased words."""
+        return frozenset(content.lower().split())
+    
+    @staticmethod
+    def _jaccard_matrix(token_sets: List[frozenset]) -> np.ndarray:
+        """Compute the pairwise Jaccard similarity of token sets as an M x M matrix."""
+        vocabulary: Dict[str, int] = {}
+        rows, cols = [], []
+        for row, tokens in enumerate(token_sets):
+            for token in tokens:
+                rows.append(row)
+                cols.append(vocabulary.setdefault(token, len(vocabulary)))
+        
+        # Binary term-document matrix: intersections come from X @ X.T and
+        # unions from |a| + |b| - |a & b|
+        matrix = np.zeros((len(token_sets), len(vocabulary)))
+        matrix[rows, cols] = 1.0
+        intersection = matrix @ matrix.T
+        sizes = matrix.sum(axis=1)
+        union = sizes[:, None] + sizes[None, :] - intersection
+        return intersection / np.maximum(union, 1.0)
+    
+    @staticmethod
+    def _timestamp_column(memories: List[Dict[str, Any]]) -> np.ndarray:
+        """Parse each memory's ``created_at`` into epoch seconds (NaN if unparseable)."""
+        timestamps = np.full(len(memories), np.nan)
+        for index, memory in enumerate(memories):
+            try:
+                created_at = datetime.fromisoformat(memory["created_at"].replace("Z", "+00:00"))
+                timestamps[index] = created_at.timestamp()
+            except (KeyError, AttributeError, ValueError):
+                # Missing, non-string or malformed timestamps stay NaN and never match
+                pass
+        return timestamps
+    
+    @classmethod
+    def _context_items(cls, memory: Dict[str, Any]) -> frozenset:
+        """Return a memory's context as a set of hashable ``(key, value)`` pairs."""
+        return frozenset(
+            (key, cls._hashable(value)) for key, value in (memory.get("context") or _EMPTY_CONTEXT).items()
+        )
+    
+    @classmethod
+    def _hashable(cls, value: Any) -> Any:
+        """Convert JSON lists and objects into equivalent hashable values."""
+        if isinstance(value, list):
+            return tuple(cls._hashable(item) for item in value)
+        if isinstance(value, dict):
+            return frozenset((key, cls._hashable(item)) for key, item in value.items())
+        return value
+    
+    async def _analyze_relationship(self, shared_context_items: int, content_similarity: float,
+                                    temporally_close: bool) -> float:
+        """Analyze the relationship strength between two memories.
+        
+        Takes the number of identical context entries, the Jaccard similarity of the two
+        contents and whether they were created within 24 hours of each other.
+        """
         
         # Simple relationship scoring based on context and content similarity
         score = 0.0
         
         # Context similarity
-        context1 = memory1.get("context", {})
-        context2 = memory2.get("context", {})
-        
-        common_keys = set(context1.keys()) & set(context2.keys())
-        if common_keys:
-            for key in common_keys:
-                if context1[key] == context2[key]:
-                    score += 0.2
+        score += shared_context_items * 0.2
         
         # Content similarity (simple keyword matching)
-        content1_words = set(memory1["content"].lower().split())
-        content2_words = set(memory2["content"].lower().split())
-        
-        if content1_words and content2_words:
-            intersection = content1_words & content2_words
-            union = content1_words | content2_words
-            jaccard_similarity = len(intersection) / len(union) if union else 0
-            score += jaccard_similarity * 0.5
-        
-        # Temporal proximity
-        try:
-            time1 = datetime.fromisoformat(memory1["created_at"].replace("Z", "+00:00"))
-            time2 = datetime.fromisoformat(memory2["created_at"].replace("Z", "+00:00"))
-            time_diff = abs((time1 - time2).total_seconds())
-            
-            # Boost score for memories created within 24 hours
-            if time_diff < 86400:  # 24 hours
-                score += 0.1
-        except Exception:
-            pass
+        score += content_similarity * 0.5
+        
+        # Boost score for memories created within 24 hours
+        if temporally_close:
+            score += 0.1
         
         return min(score, 1.0)
     
     def _classify_relationship(self, memory1: Dict[str, Any], memory2: Dict[str, Any]) -> str:
         """Classify the type of relationship between two memories."""
         
-        context1 = memory1.get("context", {})
-        context2 = memory2.get("context", {})
+        context1 = memory1.get("context") or _EMPTY_CONTEXT
+        context2 = memory2.get("context") or _EMPTY_CONTEXT
         
         # Check for contextual relationships
         if context1.get("project") == context2.get("project"):
@@ -165,31 +245,34 @@ class DreamerAI:
         else:
             return "semantic"
     
-    async def _create_summaries(self):
+    async def _create_summaries(self, all_memories: List[Dict[str, Any]]):
         """Create summary memories for clusters of related memories."""
         self.logger.info("Creating memory summaries")
         
-        # Get memories by context to find clusters
-        all_memories = await self.memory_core.query_memories("", limit=100)
-        
-        # Group by project context
-        project_groups = {}
+        # Group by project context, noting projects whose summary is already loaded
+        project_groups = defaultdict(list)
+        existing_summary_projects = set()
         for memory in all_memories:
-            project = memory.get("context", {}).get("project")
+            context = memory.get("context") or _EMPTY_CONTEXT
+            project = context.get("project")
             if project:
-                if project not in project_groups:
-                    project_groups[project] = []
                 project_groups[project].append(memory)
+                if context.get("type") == "summary":
+                    existing_summary_projects.add(project)
         
         # Create summaries for projects with multiple memories
         for project, memories in project_groups.items():
             if len(memories) >= 3:  # Only summarize if enough memories
-                await self._create_project_summary(project, memories)
+                await self._create_project_summary(project, memories, existing_summary_projects)
     
-    async def _create_project_summary(self, project: str, memories: List[Dict[str, Any]]):
-        """Create a summary memory for a project."""
+    async def _create_project_summary(self, project: str, memories: List[Dict[str, Any]],
+                                      existing_summary_projects: Set[str]):
+        """Create a summary memory for a project unless one already exists."""
+        
+        if project in existing_summary_projects:
+            return
         
-        # Check if summary already exists using context-based search
+        # The loaded memories are only a sample, so confirm with a context-based search
         existing_summaries = await self.memory_core.search_by_context({
             "type": "summary",
             "project": project
@@ -199,17 +282,16 @@ class DreamerAI:
         
         # Create summary content
         memory_count = len(memories)
-        recent_activities = []
-        
-        for memory in memories[-5:]:  # Last 5 memories
-            content_preview = memory["content"][:50] + "..." if len(memory["content"]) > 50 else memory["content"]
-            recent_activities.append(f"- {content_preview}")
+        recent_activities = "\n".join(
+            f"- {memory['content'][:50]}{'...' if len(memory['content']) > 50 else ''}"
+            for memory in memories[-5:]  # Last 5 memories
+        )
         
         summary_content = f"""Summary of {project}:
 
 Total memories: {memory_count}
 Recent activities:
-{chr(10).join(recent_activities)}
+{recent_activities}
 
 This is an automatically generated summary created by the Dreamer AI.
 Last updated: {datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")}"""
@@ -7,8 +7,11 @@ This script demonstrates how to use the Memory MCP system programmatically.
 
 import asyncio
 import json
+from operator import itemgetter
 from memory_core import MemoryCore
 
+PRIORITY_ORDER = {"critical": 4, "high": 3, "medium": 2, "low": 1, "normal": 1}
+
 
 async def example_basic_usage():
     """Basic usage example."""
@@ -143,8 +146,8 @@ async def example_advanced_usage():
     ]
     
     print("Storing memories with rich context...")
+    await memory_core.store_memories_batch(contexts)
     for item in contexts:
-        memory_id = await memory_core.store_memory(item["content"], item["context"])
         print(f"Stored: {item['content'][:50]}...")
     
     print("\n" + "="*50 + "\n")
@@ -156,8 +159,9 @@ async def example_advanced_usage():
     webapp_memories = await memory_core.query_memories("WebApp")
     print(f"\nWebApp memories ({len(webapp_memories)}):")
     for memory in webapp_memories:
-        memory_type = memory['context'].get('type', 'unknown')
-        priority = memory['context'].get('priority', 'normal')
+        context = memory['context']
+        memory_type = context.get('type', 'unknown')
+        priority = context.get('priority', 'normal')
         print(f"- [{memory_type.upper()}] {memory['content']} (Priority: {priority})")
     
     # By feature
@@ -173,16 +177,17 @@ async def example_advanced_usage():
     print("Memories by priority:")
     all_memories = await memory_core.query_memories("", 20)
     
-    priority_order = {"critical": 4, "high": 3, "medium": 2, "low": 1, "normal": 1}
-    sorted_memories = sorted(
-        all_memories, 
-        key=lambda m: priority_order.get(m['context'].get('priority', 'normal'), 1),
-        reverse=True
-    )
+    # Decorate each memory with its rank once, then sort on the rank alone
+    decorated = [
+        (PRIORITY_ORDER.get(memory['context'].get('priority', 'normal'), 1), memory)
+        for memory in all_memories
+    ]
+    decorated.sort(key=itemgetter(0), reverse=True)
     
-    for memory in sorted_memories:
-        priority = memory['context'].get('priority', 'normal')
-        memory_type = memory['context'].get('type', 'unknown')
+    for _, memory in decorated:
+        context = memory['context']
+        priority = context.get('priority', 'normal')
+        memory_type = context.get('type', 'unknown')
         print(f"[{priority.upper()}] [{memory_type.upper()}] {memory['content']}")
 
 
@@ -250,8 +255,9 @@ async def example_workflow():
     print(f"\nBackend development:")
     backend_memories = await memory_core.query_memories("backend")
     for memory in backend_memories:
-        tech = memory['context'].get('technology', '')
-        feature = memory['context'].get('feature', '')
+        context = memory['context']
+        tech = context.get('technology', '')
+        feature = context.get('feature', '')
         detail = f" ({tech})" if tech else f" ({feature})" if feature else ""
         print(f"  - {memory['content']}{detail}")
     
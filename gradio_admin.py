@@ -6,77 +6,107 @@ viewing statistics, and performing administrative tasks.
 """
 
 import asyncio
-import json
 import os
-from datetime import datetime
-from typing import List, Tuple, Dict, Any
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, List, Optional, Tuple, Dict, Any
 
-import gradio as gr
+import orjson
 import structlog
-import pandas as pd
 
 from memory_core import MemoryCore
 
+if TYPE_CHECKING:
+    import gradio as gr
+
 logger = structlog.get_logger()
 
+TIPS_MARKDOWN = """💡 **Tips:**
+
+- Use structured context (JSON) to organize your memories
+- Search supports both content and context matching
+- Memory IDs are automatically generated UUIDs
+- Higher priority scores indicate more frequently accessed memories"""
+
+
+# One entry of the recent-memories listing on the statistics tab
+_RECENT_FMT = "{i}. {content}...\n   Priority: {priority:.2f} | Type: {type}\n\n"
+
+# Fields of a query result shown in the search results table, in column order
+_ROW_FIELDS = itemgetter("id", "content", "priority_score", "node_type", "created_at")
+
+
+@lru_cache(maxsize=1)
+def _component_logger():
+    """Bind the admin component logger once, after logging has been configured."""
+    return structlog.get_logger().bind(component="gradio_admin")
+
+
+def _truncate(text: str, width: int) -> str:
+    """Cut text to ``width`` characters, marking the cut with an ellipsis."""
+    return text[:width] + "..." if len(text) > width else text
+
 
 class GradioAdminInterface:
     """Gradio-based admin interface for Memory MCP."""
     
-    def __init__(self, db_path: str = "memory_graph.db"):
+    # Read handlers only hit SQLite, so several can be in flight at once;
+    # stores stay serialized to avoid contending on the database write lock
+    READ_CONCURRENCY = 10
+    WRITE_CONCURRENCY = 1
+    
+    def __init__(self, db_path: str = "memory_graph.db", logger: Optional[Any] = None):
         self.memory_core = MemoryCore(db_path)
-        self.logger = structlog.get_logger().bind(component="gradio_admin")
+        self.logger = logger if logger is not None else _component_logger()
+        self._interface = None  # Built on first launch
         
     async def store_memory_async(self, content: str, context_json: str) -> str:
         """Store a memory asynchronously."""
         try:
             context = {}
             if context_json.strip():
-                context = json.loads(context_json)
+                context = orjson.loads(context_json)
             
             memory_id = await self.memory_core.store_memory(content, context)
             return f"✅ Memory stored successfully!\nMemory ID: {memory_id}"
         
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return "❌ Error: Invalid JSON in context field"
         except Exception as e:
             return f"❌ Error storing memory: {str(e)}"
     
-    def store_memory(self, content: str, context_json: str) -> str:
-        """Store a memory (sync wrapper)."""
-        return asyncio.run(self.store_memory_async(content, context_json))
-    
-    async def search_memories_async(self, query: str, limit: int) -> Tuple[str, pd.DataFrame]:
-        """Search memories asynchronously."""
+    async def search_memories_async(self, query: str, limit: int) -> Tuple[str, List[List[str]]]:
+        """Search memories asynchronously.
+        
+        Returns the summary text and the table rows, in the column order of the
+        results table (ID, Content, Priority, Type, Created).
+        """
         try:
             memories = await self.memory_core.query_memories(query, limit)
             
             if not memories:
-                return f"No memories found for query: '{query}'", ""
+                return f"No memories found for query: '{query}'", []
             
             # Format results
             result_text = f"Found {len(memories)} memories for '{query}':\n\n"
             
-            # Create DataFrame for table
-            table_data = []
-            for memory in memories:
-                table_data.append({
-                    "ID": memory["id"][:8] + "...",
-                    "Content": memory["content"][:100] + "..." if len(memory["content"]) > 100 else memory["content"],
-                    "Priority": f"{memory['priority_score']:.2f}",
-                    "Type": memory["node_type"],
-                    "Created": memory["created_at"][:10]  # Just the date part
-                })
+            # Plain rows are enough for the results table; no DataFrame needed.
+            # Content is cut to the column width before anything else touches it.
+            table_rows = [
+                [
+                    memory_id[:8] + "...",
+                    _truncate(content, 100),
+                    f"{priority:.2f}",
+                    node_type,
+                    created_at[:10]  # Just the date part
+                ]
+                for memory_id, content, priority, node_type, created_at in map(_ROW_FIELDS, memories)
+            ]
             
-            df = pd.DataFrame(table_data)
-            return result_text, df
+            return result_text, table_rows
         
         except Exception as e:
-            return f"❌ Error searching memories: {str(e)}", pd.DataFrame()
-    
-    def search_memories(self, query: str, limit: int) -> Tuple[str, pd.DataFrame]:
-        """Search memories (sync wrapper)."""
-        return asyncio.run(self.search_memories_async(query, limit))
+            return f"❌ Error searching memories: {str(e)}", []
     
     async def recall_memory_async(self, memory_id: str) -> str:
         """Recall a specific memory asynchronously."""
@@ -86,65 +116,75 @@ class GradioAdminInterface:
             if not memory:
                 return f"❌ Memory with ID '{memory_id}' not found."
             
-            result = f"Memory Details:\n\n"
-            result += f"ID: {memory['id']}\n"
-            result += f"Content: {memory['content']}\n"
-            result += f"Created: {memory['created_at']}\n"
-            result += f"Last Accessed: {memory['last_accessed_at']}\n"
-            result += f"Access Count: {memory['access_count']}\n"
-            result += f"Priority Score: {memory['priority_score']:.2f}\n"
-            result += f"Type: {memory['node_type']}\n"
+            parts = [
+                "Memory Details:\n\n",
+                f"ID: {memory['id']}\n",
+                f"Content: {memory['content']}\n",
+                f"Created: {memory['created_at']}\n",
+                f"Last Accessed: {memory['last_accessed_at']}\n",
+                f"Access Count: {memory['access_count']}\n",
+                f"Priority Score: {memory['priority_score']:.2f}\n",
+                f"Type: {memory['node_type']}\n",
+            ]
             
             if memory['context']:
-                result += f"Context:\n{json.dumps(memory['context'], indent=2)}\n"
+                parts.append(f"Context:\n{orjson.dumps(memory['context'], option=orjson.OPT_INDENT_2).decode()}\n")
             
-            return result
+            return "".join(parts)
         
         except Exception as e:
             return f"❌ Error recalling memory: {str(e)}"
     
-    def recall_memory(self, memory_id: str) -> str:
-        """Recall a memory (sync wrapper)."""
-        return asyncio.run(self.recall_memory_async(memory_id))
-    
     async def get_system_stats_async(self) -> Tuple[str, str, str]:
         """Get system statistics asynchronously."""
         try:
-            health = await self.memory_core.get_health_status()
+            # The health check and the recent-memories listing are independent
+            health, recent_memories = await asyncio.gather(
+                self.memory_core.get_health_status(),
+                self.memory_core.recent_memories(10)
+            )
             
             # Basic stats
-            stats_text = f"📊 System Statistics\n\n"
-            stats_text += f"Total Memories: {health['memory_count']}\n"
-            stats_text += f"Graph Size: {health['graph_size']}\n"
-            stats_text += f"Database: {health['db_path']}\n"
-            stats_text += f"Status: {health['status']}\n"
+            stats_text = "".join([
+                "📊 System Statistics\n\n",
+                f"Total Memories: {health['memory_count']}\n",
+                f"Graph Size: {health['graph_size']}\n",
+                f"Database: {health['db_path']}\n",
+                f"Status: {health['status']}\n",
+            ])
             
             # Recent memories
-            recent_memories = await self.memory_core.query_memories("", 10)
-            recent_text = "📋 Recent Memories:\n\n"
+            recent_parts = ["📋 Recent Memories:\n\n"]
             
             if recent_memories:
                 for i, memory in enumerate(recent_memories, 1):
-                    recent_text += f"{i}. {memory['content'][:80]}...\n"
-                    recent_text += f"   Priority: {memory['priority_score']:.2f} | Type: {memory['node_type']}\n\n"
+                    recent_parts.append(_RECENT_FMT.format(
+                        i=i,
+                        content=memory['content'][:80],
+                        priority=memory['priority_score'],
+                        type=memory['node_type']
+                    ))
             else:
-                recent_text += "No memories found."
+                recent_parts.append("No memories found.")
+            recent_text = "".join(recent_parts)
             
             # Context analysis
-            context_text = "🏷️ Context Analysis:\n\n"
+            context_parts = ["🏷️ Context Analysis:\n\n"]
             context_types = {}
             
             for memory in recent_memories:
                 for key, value in memory.get('context', {}).items():
-                    if key not in context_types:
-                        context_types[key] = set()
-                    context_types[key].add(str(value))
+                    # Only five values per key are displayed; stop collecting beyond that
+                    values = context_types.setdefault(key, set())
+                    if len(values) < 5:
+                        values.add(str(value))
             
             if context_types:
                 for key, values in context_types.items():
-                    context_text += f"{key.title()}: {', '.join(list(values)[:5])}\n"
+                    context_parts.append(f"{key.title()}: {', '.join(values)}\n")
             else:
-                context_text += "No context data found."
+                context_parts.append("No context data found.")
+            context_text = "".join(context_parts)
             
             return stats_text, recent_text, context_text
         
@@ -152,12 +192,27 @@ class GradioAdminInterface:
             error_msg = f"❌ Error getting system stats: {str(e)}"
             return error_msg, error_msg, error_msg
     
-    def get_system_stats(self) -> Tuple[str, str, str]:
-        """Get system statistics (sync wrapper)."""
-        return asyncio.run(self.get_system_stats_async())
+    async def _selftest(self) -> None:
+        """Exercise store, search and stats once for the --test entry point."""
+        # Test memory operations
+        result = await self.store_memory_async(
+            "Test memory from Gradio admin",
+            '{"type": "test", "source": "gradio_admin.py"}'
+        )
+        print(f"Store result: {result}")
+        
+        # Search and stats only read, so they can run side by side
+        (search_result, table), (stats, recent, context) = await asyncio.gather(
+            self.search_memories_async("test", 5),
+            self.get_system_stats_async()
+        )
+        print(f"Search result: {search_result}")
+        print(f"Stats: {stats}")
     
-    def create_interface(self) -> gr.Interface:
+    def create_interface(self) -> "gr.Blocks":
         """Create the Gradio interface."""
+        # Imported here so --test and library use skip gradio's heavy import
+        import gradio as gr
         
         with gr.Blocks(title="Memory MCP Admin Interface", theme=gr.themes.Soft()) as interface:
             gr.Markdown("# 🧠 Memory MCP Admin Interface")
@@ -192,9 +247,10 @@ class GradioAdminInterface:
                             )
                     
                     store_btn.click(
-                        self.store_memory,
+                        self.store_memory_async,
                         inputs=[memory_content, memory_context],
-                        outputs=store_result
+                        outputs=store_result,
+                        concurrency_limit=self.WRITE_CONCURRENCY
                     )
                 
                 # Search Memory Tab
@@ -236,9 +292,10 @@ class GradioAdminInterface:
                     )
                     
                     search_btn.click(
-                        self.search_memories,
+                        self.search_memories_async,
                         inputs=[search_query, search_limit],
-                        outputs=[search_result, search_table]
+                        outputs=[search_result, search_table],
+                        concurrency_limit=self.READ_CONCURRENCY
                     )
                 
                 # Recall Memory Tab
@@ -263,9 +320,10 @@ class GradioAdminInterface:
                             )
                     
                     recall_btn.click(
-                        self.recall_memory,
+                        self.recall_memory_async,
                         inputs=memory_id,
-                        outputs=recall_result
+                        outputs=recall_result,
+                        concurrency_limit=self.READ_CONCURRENCY
                     )
                 
                 # System Stats Tab
@@ -297,22 +355,20 @@ class GradioAdminInterface:
                             )
                     
                     stats_btn.click(
-                        self.get_system_stats,
-                        outputs=[system_stats, recent_memories, context_analysis]
+                        self.get_system_stats_async,
+                        outputs=[system_stats, recent_memories, context_analysis],
+                        concurrency_limit=self.READ_CONCURRENCY
                     )
                     
                     # Auto-load stats on interface load
                     interface.load(
-                        self.get_system_stats,
-                        outputs=[system_stats, recent_memories, context_analysis]
+                        self.get_system_stats_async,
+                        outputs=[system_stats, recent_memories, context_analysis],
+                        concurrency_limit=self.READ_CONCURRENCY
                     )
             
             gr.Markdown("---")
-            gr.Markdown("💡 **Tips:**")
-            gr.Markdown("- Use structured context (JSON) to organize your memories")
-            gr.Markdown("- Search supports both content and context matching")
-            gr.Markdown("- Memory IDs are automatically generated UUIDs")
-            gr.Markdown("- Higher priority scores indicate more frequently accessed memories")
+            gr.Markdown(TIPS_MARKDOWN)
         
         return interface
     
@@ -325,9 +381,10 @@ class GradioAdminInterface:
         
         self.logger.info("Starting Gradio admin interface", host=host, port=port)
         
-        interface = self.create_interface()
+        if self._interface is None:
+            self._interface = self.create_interface()
         
-        interface.launch(
+        self._interface.launch(
             server_name=host,
             server_port=port,
             share=share,
@@ -367,25 +424,11 @@ def main():
     share = os.getenv("GRADIO_SHARE", "false").lower() == "true"
     
     # Create and launch interface
-    admin_interface = GradioAdminInterface(db_path)
+    admin_interface = GradioAdminInterface(db_path, logger=_component_logger())
     
     if len(sys.argv) > 1 and sys.argv[1] == "--test":
         print("Testing Gradio admin interface...")
-        
-        # Test memory operations
-        result = admin_interface.store_memory(
-            "Test memory from Gradio admin",
-            '{"type": "test", "source": "gradio_admin.py"}'
-        )
-        print(f"Store result: {result}")
-        
-        # Test search
-        search_result, table = admin_interface.search_memories("test", 5)
-        print(f"Search result: {search_result}")
-        
-        # Test stats
-        stats, recent, context = admin_interface.get_system_stats()
-        print(f"Stats: {stats}")
+        asyncio.run(admin_interface._selftest())
         
         print("Gradio admin interface tests completed!")
     else:
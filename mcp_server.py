@@ -6,12 +6,16 @@ in a knowledge graph with temporal awareness and background AI processing.
 """
 
 import asyncio
-import json
 import os
-from typing import Any, Dict, List, Optional, Sequence
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from contextlib import asynccontextmanager
 
+import orjson
 import structlog
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
 from mcp.types import (
@@ -37,281 +41,526 @@ from mcp.types import (
 
 from memory_core import MemoryCore
 
-logger = structlog.get_logger()
+logger = structlog.get_logger(component="mcp_server")
+
+
+MEMORY_ASSISTANT_TEMPLATE = """You are a helpful memory management assistant. You have access to a knowledge base with {memory_count} memories.
+
+Current context: {context}
+
+You can help users:
+- Store new memories with appropriate context
+- Search and retrieve existing memories
+- Get overviews of their knowledge base
+- Recall specific memories by ID
+
+Always be helpful and suggest relevant memory operations when appropriate. When users mention something they might want to remember, offer to store it as a memory."""
+
+
+def _text_result(text: str) -> CallToolResult:
+    """Wrap plain text as a single-block tool result."""
+    return CallToolResult(content=[TextContent(type="text", text=text)])
+
+
+def _error_result(text: str) -> CallToolResult:
+    """Wrap an error message as a single-block tool result flagged as an error."""
+    return CallToolResult(content=[TextContent(type="text", text=text)], isError=True)
+
+
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON text with orjson, optionally pretty-printed."""
+    option = orjson.OPT_INDENT_2 if indent else 0
+    return orjson.dumps(obj, default=str, option=option).decode()
 
 
 class MCPMemoryServer:
     """MCP Memory Server implementation."""
     
-    def __init__(self, db_path: str = "memory_graph.db"):
-        self.memory_core = MemoryCore(db_path)
-        self.logger = structlog.get_logger().bind(component="mcp_server")
+    __slots__ = (
+        "memory_core",
+        "server",
+        "_query_cache",
+        "_memory_count_cache",
+        "_health_cache",
+        "_tools_list",
+        "_prompts_list",
+        "_resources_list",
+        "_tool_handlers",
+        "_validators",
+    )
+    
+    QUERY_CACHE_SIZE = 256
+    QUERY_CACHE_TTL = 30.0
+    EXHAUSTIVE_CHUNK_SIZE = 10
+    MEMORY_COUNT_TTL = 5.0
+    HEALTH_CACHE_TTL = 2.0
+    
+    def __init__(self, db_path: str = "memory_graph.db", memory_core: Optional[MemoryCore] = None):
+        self.memory_core = memory_core if memory_core is not None else MemoryCore(db_path)
+        # Cache entries carry memory_core.write_version so any store turns them into misses
+        self._query_cache: "OrderedDict[Tuple[str, int], Tuple[float, int, Tuple[Dict[str, Any], ...]]]" = OrderedDict()
+        self._memory_count_cache: Optional[Tuple[float, int, int]] = None
+        self._health_cache: Optional[Tuple[float, int, str]] = None
+        
+        # Tool, prompt and resource definitions never change, so build them once
+        self._tools_list = self._build_tools()
+        self._prompts_list = self._build_prompts()
+        self._resources_list = self._build_resources()
+        self._tool_handlers = {
+            "store_memory": self._handle_store_memory,
+            "query_memories": self._handle_query_memories,
+            "recall_memory": self._handle_recall_memory,
+            "get_knowledge_overview": self._handle_get_knowledge_overview,
+            "exhaustive_search": self._handle_exhaustive_search,
+            "batch_execute": self._batch_execute,
+        }
+        # Argument validators are compiled once from the advertised input schemas
+        self._validators = {
+            tool.name: Draft7Validator(tool.inputSchema) for tool in self._tools_list
+        }
         
         # Initialize MCP server
         self.server = Server("memory-server")
         self._setup_handlers()
     
-    def _setup_handlers(self):
-        """Set up MCP server handlers."""
-        
-        @self.server.list_tools()
-        async def handle_list_tools() -> List[Tool]:
-            """List available memory management tools."""
-            return [
-                Tool(
-                    name="store_memory",
-                    description="Store a new memory with optional context metadata",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "content": {
-                                "type": "string",
-                                "description": "The content to remember"
-                            },
-                            "context": {
-                                "type": "object",
-                                "description": "Optional context metadata (project, type, tags, etc.)",
-                                "additionalProperties": True
-                            }
+    @staticmethod
+    def _build_tools() -> List[Tool]:
+        """Build the tool definitions advertised by list_tools."""
+        return [
+            Tool(
+                name="store_memory",
+                description="Store a new memory with optional context metadata",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "content": {
+                            "type": "string",
+                            "description": "The content to remember"
                         },
-                        "required": ["content"]
-                    }
-                ),
-                Tool(
-                    name="query_memories",
-                    description="Search for memories based on content or context",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Search query to find relevant memories"
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of memories to return",
-                                "default": 10,
-                                "minimum": 1,
-                                "maximum": 100
-                            }
+                        "context": {
+                            "type": "object",
+                            "description": "Optional context metadata (project, type, tags, etc.)",
+                            "additionalProperties": True
+                        }
+                    },
+                    "required": ["content"]
+                }
+            ),
+            Tool(
+                name="query_memories",
+                description="Search for memories based on content or context",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "Search query to find relevant memories"
                         },
-                        "required": ["query"]
+                        "limit": {
+                            "type": "integer",
+                            "description": "Maximum number of memories to return",
+                            "default": 10,
+                            "minimum": 1,
+                            "maximum": 100
+                        }
+                    },
+                    "required": ["query"]
+                }
+            ),
+            Tool(
+                name="recall_memory",
+                description="Retrieve a specific memory by its ID",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "memory_id": {
+                            "type": "string",
+                            "description": "The unique ID of the memory to recall"
+                        }
+                    },
+                    "required": ["memory_id"]
+                }
+            ),
+            Tool(
+                name="get_knowledge_overview",
+                description="Get an overview of stored knowledge and memories",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "topic": {
+                            "type": "string",
+                            "description": "Optional topic to focus the overview on"
+                        }
                     }
-                ),
-                Tool(
-                    name="recall_memory",
-                    description="Retrieve a specific memory by its ID",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "memory_id": {
-                                "type": "string",
-                                "description": "The unique ID of the memory to recall"
-                            }
+                }
+            ),
+            Tool(
+                name="exhaustive_search",
+                description="Perform a comprehensive search across all memories",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "Search query for exhaustive search"
                         },
-                        "required": ["memory_id"]
-                    }
-                ),
-                Tool(
-                    name="get_knowledge_overview",
-                    description="Get an overview of stored knowledge and memories",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "topic": {
-                                "type": "string",
-                                "description": "Optional topic to focus the overview on"
-                            }
+                        "chunk_size": {
+                            "type": "integer",
+                            "description": "Number of memories per returned text block",
+                            "default": 10,
+                            "minimum": 1
                         }
-                    }
-                ),
-                Tool(
-                    name="exhaustive_search",
-                    description="Perform a comprehensive search across all memories",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Search query for exhaustive search"
+                    },
+                    "required": ["query"]
+                }
+            ),
+            Tool(
+                name="batch_execute",
+                description="Run several memory tool calls in a single request",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "operations": {
+                            "type": "array",
+                            "description": "Tool calls to run, each with a tool name and its arguments",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "tool": {"type": "string"},
+                                    "arguments": {"type": "object", "additionalProperties": True}
+                                },
+                                "required": ["tool"]
                             }
                         },
-                        "required": ["query"]
+                        "maxConcurrent": {
+                            "type": "integer",
+                            "description": "Maximum number of operations to run at once",
+                            "default": 8,
+                            "minimum": 1
+                        },
+                        "stopOnError": {
+                            "type": "boolean",
+                            "description": "Fail the whole batch on the first failed operation",
+                            "default": False
+                        }
+                    },
+                    "required": ["operations"]
+                }
+            )
+        ]
+    
+    @staticmethod
+    def _build_prompts() -> List[Prompt]:
+        """Build the prompt definitions advertised by list_prompts."""
+        return [
+            Prompt(
+                name="memory_assistant",
+                description="A helpful assistant for managing and querying your memories",
+                arguments=[
+                    {
+                        "name": "context",
+                        "description": "Current context or topic of conversation",
+                        "required": False
                     }
-                )
+                ]
+            )
+        ]
+    
+    @staticmethod
+    def _build_resources() -> List[Resource]:
+        """Build the resource definitions advertised by list_resources."""
+        return [
+            Resource(
+                uri="memory://health",
+                name="System Health",
+                description="Current health and statistics of the memory system",
+                mimeType="application/json"
+            ),
+            Resource(
+                uri="memory://recent",
+                name="Recent Memories",
+                description="Recently accessed memories",
+                mimeType="application/json"
+            )
+        ]
+    
+    async def _cached_query(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """Query memories through a small TTL-bounded LRU cache keyed by (query, limit)."""
+        key = (query, limit)
+        now = time.monotonic()
+        version = self.memory_core.write_version
+        
+        cached = self._query_cache.get(key)
+        if cached is not None and cached[0] > now and cached[1] == version:
+            self._query_cache.move_to_end(key)
+            return list(cached[2])
+        
+        memories = await self.memory_core.query_memories(query, limit)
+        self._query_cache[key] = (now + self.QUERY_CACHE_TTL, version, tuple(memories))
+        self._query_cache.move_to_end(key)
+        if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return memories
+    
+    async def _get_cached_memory_count(self) -> int:
+        """Return the stored memory count, refreshed at most every MEMORY_COUNT_TTL seconds."""
+        now = time.monotonic()
+        version = self.memory_core.write_version
+        cached = self._memory_count_cache
+        if cached is not None and cached[0] > now and cached[1] == version:
+            return cached[2]
+        
+        health = await self.memory_core.get_health_status()
+        self._memory_count_cache = (now + self.MEMORY_COUNT_TTL, version, health['memory_count'])
+        return health['memory_count']
+    
+    async def _get_cached_health_json(self) -> str:
+        """Return the health status as JSON text, refreshed at most every HEALTH_CACHE_TTL seconds."""
+        now = time.monotonic()
+        version = self.memory_core.write_version
+        cached = self._health_cache
+        if cached is not None and cached[0] > now and cached[1] == version:
+            return cached[2]
+        
+        health = await self.memory_core.get_health_status()
+        health_json = _dumps(health, indent=True)
+        self._health_cache = (now + self.HEALTH_CACHE_TTL, version, health_json)
+        return health_json
+    
+    async def _handle_store_memory(self, arguments: dict) -> CallToolResult:
+        """Store a new memory."""
+        content = arguments["content"]
+        context = arguments.get("context", {})
+        
+        memory_id = await self.memory_core.store_memory(content, context)
+        self._query_cache.clear()
+        self._memory_count_cache = None
+        self._health_cache = None
+        
+        return _text_result(f"✓ Memory stored successfully with ID: {memory_id}")
+    
+    async def _handle_query_memories(self, arguments: dict) -> CallToolResult:
+        """Search memories by content or context."""
+        query = arguments["query"]
+        limit = arguments.get("limit", 10)
+        
+        memories = await self._cached_query(query, limit)
+        
+        if not memories:
+            response = f"No memories found for query: '{query}'"
+        else:
+            parts = [f"Found {len(memories)} memories for '{query}':\n\n"]
+            for i, memory in enumerate(memories, 1):
+                parts.append(f"{i}. {memory['content']}\n")
+                parts.append(f"   ID: {memory['id']}\n")
+                parts.append(f"   Priority: {memory['priority_score']:.2f}\n")
+                if memory['context']:
+                    parts.append(f"   Context: {_dumps(memory['context'])}\n")
+                parts.append("\n")
+            response = "".join(parts)
+        
+        return _text_result(response)
+    
+    async def _handle_recall_memory(self, arguments: dict) -> CallToolResult:
+        """Recall a single memory by ID."""
+        memory_id = arguments["memory_id"]
+        
+        memory = await self.memory_core.recall_memory(memory_id)
+        
+        if not memory:
+            response = f"Memory with ID '{memory_id}' not found."
+        else:
+            parts = [
+                f"Memory ID: {memory['id']}\n",
+                f"Content: {memory['content']}\n",
+                f"Created: {memory['created_at']}\n",
+                f"Last Accessed: {memory['last_accessed_at']}\n",
+                f"Access Count: {memory['access_count']}\n",
+                f"Priority Score: {memory['priority_score']:.2f}\n",
+                f"Type: {memory['node_type']}\n",
             ]
+            if memory['context']:
+                parts.append(f"Context: {_dumps(memory['context'], indent=True)}\n")
+            response = "".join(parts)
+        
+        return _text_result(response)
+    
+    async def _handle_get_knowledge_overview(self, arguments: dict) -> CallToolResult:
+        """Summarise the knowledge base, optionally around a topic."""
+        topic = arguments.get("topic")
+        
+        if topic:
+            # Search for memories related to the topic
+            memories = await self._cached_query(topic, 50)
+            parts = [f"Knowledge Overview for '{topic}':\n\n"]
+        else:
+            # Get general overview; health and recent memories are independent reads
+            health, recent_memories = await asyncio.gather(
+                self.memory_core.get_health_status(),
+                self._cached_query("", 5)
+            )
+            parts = [
+                "Knowledge Base Overview:\n\n",
+                f"📊 Total Memories: {health['memory_count']}\n",
+                f"🔗 Graph Size: {health['graph_size']}\n",
+                f"💾 Database: {health['db_path']}\n\n",
+            ]
+            
+            if recent_memories:
+                parts.append("Recent Memories:\n")
+                for memory in recent_memories:
+                    parts.append(f"- {memory['content'][:100]}...\n")
+            
+            return _text_result("".join(parts))
+        
+        if memories:
+            # Analyze context types, keeping only the five values per key that are shown
+            context_types = defaultdict(set)
+            for memory in memories:
+                context = memory.get('context')
+                if not context:
+                    continue
+                for key, value in context.items():
+                    values = context_types[key]
+                    if len(values) < 5:
+                        values.add(str(value))
+            
+            parts.append(f"📋 Found {len(memories)} related memories\n")
+            for key, values in context_types.items():
+                parts.append(f"🏷️ {key.title()}: {', '.join(values)}\n")
+            
+            parts.append("\nTop Memories:\n")
+            for i, memory in enumerate(memories[:10], 1):
+                parts.append(f"{i}. {memory['content'][:80]}...\n")
+        else:
+            parts.append(f"No memories found related to '{topic}'")
+        
+        return _text_result("".join(parts))
+    
+    async def _handle_exhaustive_search(self, arguments: dict) -> CallToolResult:
+        """Search broadly and list every match in full."""
+        query = arguments["query"]
+        
+        # Perform broader search with higher limit
+        memories = await self._cached_query(query, 100)
+        
+        # Results are delivered as several text blocks of chunk_size memories each,
+        # so no single string has to hold the whole listing
+        chunk_size = arguments.get("chunk_size", self.EXHAUSTIVE_CHUNK_SIZE)
+        content = [
+            TextContent(
+                type="text",
+                text=f"Exhaustive Search Results for '{query}':\n\nFound {len(memories)} total memories\n\n"
+            )
+        ]
+        
+        parts = []
+        for i, memory in enumerate(memories, 1):
+            parts.append(f"{i}. {memory['content']}\n")
+            parts.append(f"   ID: {memory['id']}\n")
+            parts.append(f"   Priority: {memory['priority_score']:.2f}\n")
+            parts.append(f"   Created: {memory['created_at']}\n")
+            if memory['context']:
+                parts.append(f"   Context: {_dumps(memory['context'])}\n")
+            parts.append("\n")
+            
+            if i % chunk_size == 0:
+                content.append(TextContent(type="text", text="".join(parts)))
+                parts = []
+        
+        if parts:
+            content.append(TextContent(type="text", text="".join(parts)))
+        
+        return CallToolResult(content=content)
+    
+    async def _dispatch_tool(self, name: str, arguments: dict) -> CallToolResult:
+        """Run a single tool call; errors propagate to the caller."""
+        handler = self._tool_handlers.get(name)
+        if handler is None:
+            return _error_result(f"Unknown tool: {name}")
+        
+        error = best_match(self._validators[name].iter_errors(arguments))
+        if error is not None:
+            return _error_result(f"Invalid arguments for {name}: {error.message}")
+        
+        return await handler(arguments)
+    
+    async def call_tool_direct(self, name: str, arguments: Dict[str, Any]) -> str:
+        """Call a tool in-process and return its text, bypassing the MCP protocol layer.
+        
+        Unlike calls made over MCP, errors are raised to the caller rather than
+        being turned into an error message.
+        """
+        result = await self._dispatch_tool(name, arguments)
+        return "".join(item.text for item in result.content)
+    
+    async def _batch_execute(self, arguments: dict) -> CallToolResult:
+        """Run several tool calls in one request with bounded concurrency."""
+        operations = arguments["operations"]
+        semaphore = asyncio.Semaphore(arguments.get("maxConcurrent", 8))
+        stop_on_error = arguments.get("stopOnError", False)
+        
+        async def run_operation(operation: dict) -> Dict[str, Any]:
+            tool = operation["tool"]
+            if tool == "batch_execute":
+                raise ValueError("batch_execute cannot be nested")
+            async with semaphore:
+                result = await self._dispatch_tool(tool, operation.get("arguments", {}))
+            text = "".join(item.text for item in result.content)
+            if result.isError:
+                # Unknown tools and invalid arguments fail the operation like a raised error
+                raise ValueError(text)
+            return {"tool": tool, "result": text}
+        
+        tasks = [asyncio.create_task(run_operation(operation)) for operation in operations]
+        try:
+            outcomes = await asyncio.gather(*tasks, return_exceptions=not stop_on_error)
+        except BaseException:
+            # With stopOnError the first failure ends the batch, so stop the rest and let
+            # them settle before the caches are cleared below
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            # Queries in the same batch may have cached results from before a store
+            if any(operation.get("tool") == "store_memory" for operation in operations):
+                self._query_cache.clear()
+                self._memory_count_cache = None
+                self._health_cache = None
+        
+        results = []
+        for operation, outcome in zip(operations, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Batch operation failed", tool=operation.get("tool"), error=str(outcome))
+                results.append({"tool": operation.get("tool"), "error": str(outcome)})
+            else:
+                results.append(outcome)
+        
+        return _text_result(_dumps(results))
+    
+    def _setup_handlers(self):
+        """Set up MCP server handlers."""
+        
+        @self.server.list_tools()
+        async def handle_list_tools() -> List[Tool]:
+            """List available memory management tools."""
+            return self._tools_list
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: dict) -> CallToolResult:
             """Handle tool calls."""
             try:
-                if name == "store_memory":
-                    content = arguments["content"]
-                    context = arguments.get("context", {})
-                    
-                    memory_id = await self.memory_core.store_memory(content, context)
-                    
-                    return CallToolResult(
-                        content=[
-                            TextContent(
-                                type="text",
-                                text=f"✓ Memory stored successfully with ID: {memory_id}"
-                            )
-                        ]
-                    )
-                
-                elif name == "query_memories":
-                    query = arguments["query"]
-                    limit = arguments.get("limit", 10)
-                    
-                    memories = await self.memory_core.query_memories(query, limit)
-                    
-                    if not memories:
-                        response = f"No memories found for query: '{query}'"
-                    else:
-                        response = f"Found {len(memories)} memories for '{query}':\n\n"
-                        for i, memory in enumerate(memories, 1):
-                            response += f"{i}. {memory['content']}\n"
-                            response += f"   ID: {memory['id']}\n"
-                            response += f"   Priority: {memory['priority_score']:.2f}\n"
-                            if memory['context']:
-                                response += f"   Context: {json.dumps(memory['context'])}\n"
-                            response += "\n"
-                    
-                    return CallToolResult(
-                        content=[TextContent(type="text", text=response)]
-                    )
-                
-                elif name == "recall_memory":
-                    memory_id = arguments["memory_id"]
-                    
-                    memory = await self.memory_core.recall_memory(memory_id)
-                    
-                    if not memory:
-                        response = f"Memory with ID '{memory_id}' not found."
-                    else:
-                        response = f"Memory ID: {memory['id']}\n"
-                        response += f"Content: {memory['content']}\n"
-                        response += f"Created: {memory['created_at']}\n"
-                        response += f"Last Accessed: {memory['last_accessed_at']}\n"
-                        response += f"Access Count: {memory['access_count']}\n"
-                        response += f"Priority Score: {memory['priority_score']:.2f}\n"
-                        response += f"Type: {memory['node_type']}\n"
-                        if memory['context']:
-                            response += f"Context: {json.dumps(memory['context'], indent=2)}\n"
-                    
-                    return CallToolResult(
-                        content=[TextContent(type="text", text=response)]
-                    )
-                
-                elif name == "get_knowledge_overview":
-                    topic = arguments.get("topic")
-                    
-                    if topic:
-                        # Search for memories related to the topic
-                        memories = await self.memory_core.query_memories(topic, 50)
-                        response = f"Knowledge Overview for '{topic}':\n\n"
-                    else:
-                        # Get general overview
-                        health = await self.memory_core.get_health_status()
-                        response = f"Knowledge Base Overview:\n\n"
-                        response += f"📊 Total Memories: {health['memory_count']}\n"
-                        response += f"🔗 Graph Size: {health['graph_size']}\n"
-                        response += f"💾 Database: {health['db_path']}\n\n"
-                        
-                        # Get recent memories
-                        recent_memories = await self.memory_core.query_memories("", 5)
-                        if recent_memories:
-                            response += "Recent Memories:\n"
-                            for memory in recent_memories:
-                                response += f"- {memory['content'][:100]}...\n"
-                        
-                        return CallToolResult(
-                            content=[TextContent(type="text", text=response)]
-                        )
-                    
-                    if memories:
-                        # Analyze context types
-                        context_types = {}
-                        for memory in memories:
-                            for key, value in memory.get('context', {}).items():
-                                if key not in context_types:
-                                    context_types[key] = set()
-                                context_types[key].add(str(value))
-                        
-                        response += f"📋 Found {len(memories)} related memories\n"
-                        for key, values in context_types.items():
-                            response += f"🏷️ {key.title()}: {', '.join(list(values)[:5])}\n"
-                        
-                        response += "\nTop Memories:\n"
-                        for i, memory in enumerate(memories[:10], 1):
-                            response += f"{i}. {memory['content'][:80]}...\n"
-                    else:
-                        response += f"No memories found related to '{topic}'"
-                    
-                    return CallToolResult(
-                        content=[TextContent(type="text", text=response)]
-                    )
-                
-                elif name == "exhaustive_search":
-                    query = arguments["query"]
-                    
-                    # Perform broader search with higher limit
-                    memories = await self.memory_core.query_memories(query, 100)
-                    
-                    response = f"Exhaustive Search Results for '{query}':\n\n"
-                    response += f"Found {len(memories)} total memories\n\n"
-                    
-                    for i, memory in enumerate(memories, 1):
-                        response += f"{i}. {memory['content']}\n"
-                        response += f"   ID: {memory['id']}\n"
-                        response += f"   Priority: {memory['priority_score']:.2f}\n"
-                        response += f"   Created: {memory['created_at']}\n"
-                        if memory['context']:
-                            response += f"   Context: {json.dumps(memory['context'])}\n"
-                        response += "\n"
-                    
-                    return CallToolResult(
-                        content=[TextContent(type="text", text=response)]
-                    )
-                
-                else:
-                    return CallToolResult(
-                        content=[
-                            TextContent(
-                                type="text",
-                                text=f"Unknown tool: {name}"
-                            )
-                        ]
-                    )
+                return await self._dispatch_tool(name, arguments)
             
             except Exception as e:
-                self.logger.error("Tool call failed", tool=name, error=str(e))
-                return CallToolResult(
-                    content=[
-                        TextContent(
-                            type="text",
-                            text=f"Error executing {name}: {str(e)}"
-                        )
-                    ]
-                )
+                logger.error("Tool call failed", tool=name, error=str(e))
+                return _error_result(f"Error executing {name}: {str(e)}")
         
         @self.server.list_prompts()
         async def handle_list_prompts() -> List[Prompt]:
             """List available prompts."""
-            return [
-                Prompt(
-                    name="memory_assistant",
-                    description="A helpful assistant for managing and querying your memories",
-                    arguments=[
-                        {
-                            "name": "context",
-                            "description": "Current context or topic of conversation",
-                            "required": False
-                        }
-                    ]
-                )
-            ]
+            return self._prompts_list
         
         @self.server.get_prompt()
         async def handle_get_prompt(name: str, arguments: dict) -> GetPromptResult:
@@ -319,20 +568,11 @@ class MCPMemoryServer:
             if name == "memory_assistant":
                 context = arguments.get("context", "general")
                 
-                health = await self.memory_core.get_health_status()
+                memory_count = await self._get_cached_memory_count()
+                system_message = MEMORY_ASSISTANT_TEMPLATE.format_map(
+                    {"memory_count": memory_count, "context": context}
+                )
                 
-                system_message = f"""You are a helpful memory management assistant. You have access to a knowledge base with {health['memory_count']} memories.
-
-Current context: {context}
-
-You can help users:
-- Store new memories with appropriate context
-- Search and retrieve existing memories
-- Get overviews of their knowledge base
-- Recall specific memories by ID
-
-Always be helpful and suggest relevant memory operations when appropriate. When users mention something they might want to remember, offer to store it as a memory."""
-
                 return GetPromptResult(
                     description="Memory management assistant prompt",
                     messages=[
@@ -348,42 +588,28 @@ Always be helpful and suggest relevant memory operations when appropriate. When
         @self.server.list_resources()
         async def handle_list_resources() -> List[Resource]:
             """List available resources."""
-            return [
-                Resource(
-                    uri="memory://health",
-                    name="System Health",
-                    description="Current health and statistics of the memory system",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="memory://recent",
-                    name="Recent Memories",
-                    description="Recently accessed memories",
-                    mimeType="application/json"
-                )
-            ]
+            return self._resources_list
         
         @self.server.read_resource()
         async def handle_read_resource(uri: str) -> ReadResourceResult:
             """Read a specific resource."""
             if uri == "memory://health":
-                health = await self.memory_core.get_health_status()
                 return ReadResourceResult(
                     contents=[
                         TextContent(
                             type="text",
-                            text=json.dumps(health, indent=2)
+                            text=await self._get_cached_health_json()
                         )
                     ]
                 )
             
             elif uri == "memory://recent":
-                recent_memories = await self.memory_core.query_memories("", 10)
+                recent_memories = await self._cached_query("", 10)
                 return ReadResourceResult(
                     contents=[
                         TextContent(
                             type="text",
-                            text=json.dumps(recent_memories, indent=2)
+                            text=_dumps(recent_memories, indent=True)
                         )
                     ]
                 )
@@ -394,7 +620,7 @@ Always be helpful and suggest relevant memory operations when appropriate. When
         """Run the MCP server over stdio."""
         from mcp.server.stdio import stdio_server
         
-        self.logger.info("Starting MCP Memory Server on stdio")
+        logger.info("Starting MCP Memory Server on stdio")
         
         async with stdio_server() as (read_stream, write_stream):
             await self.server.run(
@@ -411,27 +637,40 @@ Always be helpful and suggest relevant memory operations when appropriate. When
             )
 
 
-async def main():
-    """Main entry point for the MCP memory server."""
-    import sys
+def _configure_logging() -> None:
+    """Configure structlog for the MCP server process.
+    
+    Log calls here pass keyword context only, so no positional-argument formatting
+    is needed; stack_info rendering is added when MEMORY_DEBUG is set.
+    """
+    processors = [
+        structlog.stdlib.filter_by_level,
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso"),
+    ]
+    if os.getenv("MEMORY_DEBUG", "false").lower() in ("1", "true"):
+        processors.append(structlog.processors.StackInfoRenderer())
+    processors += [
+        # Kept unconditionally so exc_info on error logs always renders a traceback
+        structlog.processors.format_exc_info,
+        structlog.processors.UnicodeDecoder(),
+        structlog.processors.JSONRenderer()
+    ]
     
-    # Configure logging
     structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
-        ],
+        processors=processors,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
+
+
+async def main():
+    """Main entry point for the MCP memory server."""
+    import sys
+    
+    _configure_logging()
     
     # Get database path from environment
     db_path = os.getenv("MEMORY_DB_PATH", "memory_graph.db")
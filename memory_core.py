@@ -7,15 +7,20 @@ for discovering relationships between memories in a knowledge graph structure.
 
 import asyncio
 import uuid
+import sqlite3
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
-import json
-import aiosqlite
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
 import os
+import queue
+import re
+import threading
 from pathlib import Path
 
+import orjson
 import structlog
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 # Configure structured logging
 structlog.configure(
@@ -37,6 +42,87 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
+# Settings that SQLite keeps per connection, so every new connection applies them
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA cache_size = -64000;
+    PRAGMA busy_timeout = 5000;
+"""
+
+# Timestamps are stored as INTEGER milliseconds since the epoch (UTC), which are
+# smaller than ISO-8601 text and compare as plain integers in the indexes
+_NODES_TABLE_DEFINITION = """(
+    id TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    context TEXT,
+    created_at INTEGER NOT NULL,
+    last_accessed_at INTEGER NOT NULL,
+    access_count INTEGER DEFAULT 0,
+    priority_score REAL DEFAULT 1.0,
+    node_type TEXT DEFAULT 'normal'
+)"""
+
+# Columns read for a memory node, in MemoryNode field order
+_NODE_COLUMNS = "id, content, context, created_at, last_accessed_at, access_count, priority_score, node_type"
+
+# Kept as one constant so single and batch stores share the same statement text,
+# and so the same entry in the connection's statement cache
+_SQL_INSERT_MEMORY = f"""
+    INSERT INTO memory_nodes ({_NODE_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Memory and relationship counts, read from the trigger-maintained memory_counts
+# table or recounted from the tables themselves
+_SQL_TRACKED_COUNTS = """
+    SELECT (SELECT n FROM memory_counts WHERE name = 'memory_nodes'),
+           (SELECT n FROM memory_counts WHERE name = 'memory_relationships')
+"""
+_SQL_EXACT_COUNTS = """
+    SELECT (SELECT COUNT(*) FROM memory_nodes),
+           (SELECT COUNT(*) FROM memory_relationships)
+"""
+
+# Characters with special meaning in a GLOB pattern
+_GLOB_SPECIAL = re.compile(r"[*?\[]")
+
+# Context keys with an expression index, so context searches on them are index
+# lookups. SQLite only uses the index when the query repeats the expression with the
+# same literal path, so search_by_context inlines the path for these keys
+_INDEXED_CONTEXT_KEYS = ("project", "type")
+
+# Text indexed for a memory's context: its values joined by a unit separator, so a
+# single match cannot span two values
+_FTS_CONTEXT_VALUES = "(SELECT group_concat(value, char(31)) FROM json_each({row}.context))"
+
+
+def _to_epoch_ms(moment: datetime) -> int:
+    """Convert a datetime to the stored epoch-millisecond form."""
+    return int(moment.timestamp() * 1000)
+
+
+def _from_epoch_ms(epoch_ms: int) -> datetime:
+    """Convert a stored epoch-millisecond timestamp to an aware UTC datetime."""
+    return datetime.fromtimestamp(epoch_ms / 1000, tz=timezone.utc)
+
+
+def _decode_json_value(value: Any, json_type: str) -> Any:
+    """Convert a ``json_each`` value and type back to the decoded Python value."""
+    if json_type in ("array", "object"):
+        return orjson.loads(value)
+    if json_type == "true":
+        return True
+    if json_type == "false":
+        return False
+    return value
+
+
+def _dump_context(context: Dict[str, Any]) -> str:
+    """Serialize a context dict for the context column."""
+    return orjson.dumps(context, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 class MemoryNode(BaseModel):
     """Represents a memory node in the knowledge graph."""
@@ -50,10 +136,9 @@ class MemoryNode(BaseModel):
     priority_score: float = 1.0
     node_type: str = "normal"  # normal, summary, abstract
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    @field_serializer("created_at", "last_accessed_at", when_used="json")
+    def _serialize_timestamp(self, value: datetime) -> str:
+        return value.isoformat()
 
 
 class MemoryRelationship(BaseModel):
@@ -65,259 +150,725 @@ class MemoryRelationship(BaseModel):
     relationship_type: str  # temporal, contextual, semantic
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    @field_serializer("created_at", when_used="json")
+    def _serialize_timestamp(self, value: datetime) -> str:
+        return value.isoformat()
 
 
 class MemoryDatabase:
     """SQLite-based storage for the memory graph."""
     
+    # Read-only connections kept for queries, so reads neither wait on each other nor on writes
+    READER_COUNT = 4
+    # Rows fetched per trip to a reader thread when streaming search results
+    STREAM_BATCH_SIZE = 25
+    
     def __init__(self, db_path: str = "memory_graph.db"):
         self.db_path = db_path
         self.logger = structlog.get_logger().bind(component="database")
-        # Database will be initialized on first use
+        # Database will be initialized on first use; the lock keeps concurrent first
+        # calls from each running the schema setup
         self._initialized = False
+        self._init_lock = asyncio.Lock()
+        # The writer connection is opened on first use and kept, so SQLite's page cache
+        # stays warm between calls. It is only ever touched from the single writer
+        # thread, which also serializes every write.
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="memory-db")
+        # Queries run on their own threads, each borrowing a read-only connection from
+        # the pool; with WAL they see every committed write without blocking it
+        self._readers: "queue.SimpleQueue[sqlite3.Connection]" = queue.SimpleQueue()
+        self._reader_executor = ThreadPoolExecutor(max_workers=self.READER_COUNT, thread_name_prefix="memory-db-reader")
     
     async def _ensure_initialized(self):
         """Ensure the database is initialized."""
         if not self._initialized:
-            await self._init_database()
-            self._initialized = True
+            async with self._init_lock:
+                if not self._initialized:
+                    await self._init_database()
+                    self._initialized = True
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Return the writer connection, opening it on first use (writer thread only).
+        
+        The connection runs in autocommit mode, so each statement is its own
+        transaction unless one is started explicitly.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.executescript(_CONNECTION_PRAGMAS)
+            self._conn = conn
+        return self._conn
+    
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection to the database file."""
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(_CONNECTION_PRAGMAS)
+        return conn
+    
+    def _acquire_reader(self) -> sqlite3.Connection:
+        """Take a reader connection from the pool, opening one if none is free."""
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            return self._open_reader()
+    
+    def _release_reader(self, conn: sqlite3.Connection) -> None:
+        """Return a reader connection to the pool, closing it if the pool is full.
+        
+        Streaming searches hold a connection between reader tasks, so more than
+        READER_COUNT can be out at once; the extras are not kept.
+        """
+        if self._readers.qsize() < self.READER_COUNT:
+            self._readers.put(conn)
+        else:
+            conn.close()
+    
+    def _with_reader(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run ``func`` with a pooled reader connection (reader threads only)."""
+        conn = self._acquire_reader()
+        try:
+            return func(conn)
+        finally:
+            self._release_reader(conn)
+    
+    async def _run(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run ``func(connection)`` on the writer thread and return its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: func(self._connection()))
+    
+    async def _read(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run ``func(connection)`` on a reader thread and return its result."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._reader_executor, self._with_reader, func)
+    
+    async def _fetchall(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        """Execute a query on a reader and return all of its rows."""
+        return await self._read(lambda conn: conn.execute(sql, params).fetchall())
+    
+    async def _fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[sqlite3.Row]:
+        """Execute a query on a reader and return its first row, if any."""
+        return await self._read(lambda conn: conn.execute(sql, params).fetchone())
+    
+    async def _execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """Execute a statement on the writer and return the number of rows it changed."""
+        return await self._run(lambda conn: conn.execute(sql, params).rowcount)
+    
+    async def close(self):
+        """Close the writer and all pooled reader connections."""
+        def close_connection(conn: sqlite3.Connection) -> None:
+            # Let SQLite refresh statistics for any index the session's queries would benefit from
+            conn.execute("PRAGMA optimize")
+            conn.close()
+            self._conn = None
+        
+        # Readers go first so the writer is the last connection out and can
+        # checkpoint the WAL back into the database file
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        
+        if self._conn is not None:
+            await self._run(close_connection)
     
     async def _init_database(self):
         """Initialize the SQLite database with required tables."""
-        try:
-            async with aiosqlite.connect(self.db_path) as conn:
-                cursor = await conn.cursor()
-                
-                # Memory nodes table
-                await cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS memory_nodes (
-                        id TEXT PRIMARY KEY,
-                        content TEXT NOT NULL,
-                        context TEXT,
-                        created_at TEXT NOT NULL,
-                        last_accessed_at TEXT NOT NULL,
-                        access_count INTEGER DEFAULT 0,
-                        priority_score REAL DEFAULT 1.0,
-                        node_type TEXT DEFAULT 'normal'
-                    )
+        def create_schema(conn: sqlite3.Connection) -> None:
+            # WAL lets readers proceed during writes and avoids an fsync per
+            # commit under synchronous=NORMAL; the mode persists in the file
+            conn.execute("PRAGMA journal_mode = WAL")
+            
+            # Memory nodes table
+            conn.execute(f"CREATE TABLE IF NOT EXISTS memory_nodes {_NODES_TABLE_DEFINITION}")
+            
+            declared_types = {row["name"]: row["type"] for row in conn.execute("PRAGMA table_info(memory_nodes)")}
+            migrated = declared_types["created_at"] == "TEXT"
+            if migrated:
+                self._migrate_timestamps(conn)
+            
+            # Memory relationships table
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS memory_relationships (
+                    from_node_id TEXT,
+                    to_node_id TEXT,
+                    weight REAL,
+                    relationship_type TEXT,
+                    created_at TEXT,
+                    PRIMARY KEY (from_node_id, to_node_id),
+                    FOREIGN KEY (from_node_id) REFERENCES memory_nodes (id),
+                    FOREIGN KEY (to_node_id) REFERENCES memory_nodes (id)
+                )
+            """)
+            
+            # Indexes for performance
+            # Matches the priority/recency ORDER BY used by listing and search, so
+            # results come presorted from the index instead of a temporary B-tree
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_nodes_priority_accessed
+                ON memory_nodes (priority_score DESC, last_accessed_at DESC, id)
+            """)
+            conn.execute("DROP INDEX IF EXISTS idx_nodes_priority")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_nodes_accessed ON memory_nodes (last_accessed_at DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_relationships_weight ON memory_relationships (weight DESC)")
+            for key in _INDEXED_CONTEXT_KEYS:
+                conn.execute(f"""
+                    CREATE INDEX IF NOT EXISTS idx_nodes_context_{key}
+                    ON memory_nodes (json_extract(context, '$.{key}'))
                 """)
-                
-                # Memory relationships table
-                await cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS memory_relationships (
-                        from_node_id TEXT,
-                        to_node_id TEXT,
-                        weight REAL,
-                        relationship_type TEXT,
-                        created_at TEXT,
-                        PRIMARY KEY (from_node_id, to_node_id),
-                        FOREIGN KEY (from_node_id) REFERENCES memory_nodes (id),
-                        FOREIGN KEY (to_node_id) REFERENCES memory_nodes (id)
-                    )
+            
+            # Full-text index for search. The trigram tokenizer matches any substring of
+            # three or more characters, like the LIKE '%query%' it replaces, and context is
+            # indexed by its values only (keys never matched before either). FTS rows share
+            # the rowid of their memory_nodes row, so the triggers delete by rowid lookup
+            fts_sql = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'memory_nodes_fts'"
+            ).fetchone()
+            # Older files keyed FTS rows on an unindexed id column, and rebuilding
+            # memory_nodes renumbers its rowids; either way the index is rebuilt
+            rebuild_fts = fts_sql is None or migrated or "id UNINDEXED" in fts_sql["sql"]
+            if rebuild_fts:
+                conn.executescript("""
+                    DROP TRIGGER IF EXISTS memory_nodes_fts_insert;
+                    DROP TRIGGER IF EXISTS memory_nodes_fts_delete;
+                    DROP TRIGGER IF EXISTS memory_nodes_fts_update;
+                    DROP TABLE IF EXISTS memory_nodes_fts;
                 """)
-                
-                # Indexes for performance
-                await cursor.execute("CREATE INDEX IF NOT EXISTS idx_nodes_priority ON memory_nodes (priority_score DESC)")
-                await cursor.execute("CREATE INDEX IF NOT EXISTS idx_nodes_accessed ON memory_nodes (last_accessed_at DESC)")
-                await cursor.execute("CREATE INDEX IF NOT EXISTS idx_relationships_weight ON memory_relationships (weight DESC)")
-                
-                await conn.commit()
-                self.logger.info("Database initialized successfully")
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS memory_nodes_fts
+                USING fts5(content, context, tokenize = 'trigram')
+            """)
+            conn.executescript(f"""
+                CREATE TRIGGER IF NOT EXISTS memory_nodes_fts_insert AFTER INSERT ON memory_nodes BEGIN
+                    INSERT INTO memory_nodes_fts (rowid, content, context)
+                    VALUES (new.rowid, new.content, {_FTS_CONTEXT_VALUES.format(row="new")});
+                END;
+                CREATE TRIGGER IF NOT EXISTS memory_nodes_fts_delete AFTER DELETE ON memory_nodes BEGIN
+                    DELETE FROM memory_nodes_fts WHERE rowid = old.rowid;
+                END;
+                CREATE TRIGGER IF NOT EXISTS memory_nodes_fts_update AFTER UPDATE OF content, context ON memory_nodes BEGIN
+                    DELETE FROM memory_nodes_fts WHERE rowid = old.rowid;
+                    INSERT INTO memory_nodes_fts (rowid, content, context)
+                    VALUES (new.rowid, new.content, {_FTS_CONTEXT_VALUES.format(row="new")});
+                END;
+            """)
+            if rebuild_fts:
+                # Index memories stored before the current full-text table existed
+                conn.execute(f"""
+                    INSERT INTO memory_nodes_fts (rowid, content, context)
+                    SELECT rowid, content, {_FTS_CONTEXT_VALUES.format(row="memory_nodes")} FROM memory_nodes
+                """)
+            
+            # Row counts kept up to date by triggers, so health checks need no COUNT(*) scan
+            counts_exist = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memory_counts'"
+            ).fetchone()
+            conn.execute("CREATE TABLE IF NOT EXISTS memory_counts (name TEXT PRIMARY KEY, n INTEGER NOT NULL)")
+            for table in ("memory_nodes", "memory_relationships"):
+                conn.executescript(f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_count_insert AFTER INSERT ON {table} BEGIN
+                        UPDATE memory_counts SET n = n + 1 WHERE name = '{table}';
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS {table}_count_delete AFTER DELETE ON {table} BEGIN
+                        UPDATE memory_counts SET n = n - 1 WHERE name = '{table}';
+                    END;
+                """)
+                if not counts_exist:
+                    conn.execute(f"INSERT INTO memory_counts (name, n) SELECT '{table}', COUNT(*) FROM {table}")
+        
+        try:
+            await self._run(create_schema)
+            self.logger.info("Database initialized successfully")
                 
         except Exception as e:
             self.logger.error("Failed to initialize database", error=str(e))
             raise
     
+    @staticmethod
+    def _memory_params(memory: MemoryNode) -> tuple:
+        """Build the ``_SQL_INSERT_MEMORY`` parameters for a memory node."""
+        return (
+            memory.id,
+            memory.content,
+            _dump_context(memory.context),
+            _to_epoch_ms(memory.created_at),
+            _to_epoch_ms(memory.last_accessed_at),
+            memory.access_count,
+            memory.priority_score,
+            memory.node_type
+        )
+    
+    def _migrate_timestamps(self, conn: sqlite3.Connection) -> None:
+        """Rebuild a memory_nodes table that still stores ISO-8601 timestamp text.
+        
+        The column types can only change by copying the table. Dropping the old
+        table also drops its indexes and triggers, which schema setup recreates.
+        Julian day arithmetic is not exact in floating point, so the converted
+        milliseconds are rounded rather than truncated.
+        """
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(f"CREATE TABLE memory_nodes_migrated {_NODES_TABLE_DEFINITION}")
+            conn.execute(f"""
+                INSERT INTO memory_nodes_migrated ({_NODE_COLUMNS})
+                SELECT id, content, context,
+                       CAST(ROUND((julianday(created_at) - 2440587.5) * 86400000) AS INTEGER),
+                       CAST(ROUND((julianday(last_accessed_at) - 2440587.5) * 86400000) AS INTEGER),
+                       access_count, priority_score, node_type
+                FROM memory_nodes
+            """)
+            conn.execute("DROP TABLE memory_nodes")
+            conn.execute("ALTER TABLE memory_nodes_migrated RENAME TO memory_nodes")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        
+        self.logger.info("Migrated memory timestamps to epoch milliseconds")
+    
     async def store_memory(self, memory: MemoryNode) -> str:
         """Store a memory node in the database."""
         await self._ensure_initialized()
         try:
-            async with aiosqlite.connect(self.db_path) as conn:
-                cursor = await conn.cursor()
-                await cursor.execute("""
-                    INSERT INTO memory_nodes 
-                    (id, content, context, created_at, last_accessed_at, access_count, priority_score, node_type)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    memory.id,
-                    memory.content,
-                    json.dumps(memory.context),
-                    memory.created_at.isoformat(),
-                    memory.last_accessed_at.isoformat(),
-                    memory.access_count,
-                    memory.priority_score,
-                    memory.node_type
-                ))
-                await conn.commit()
-                
-                self.logger.info("Memory stored", memory_id=memory.id, content_length=len(memory.content))
-                return memory.id
+            await self._execute(_SQL_INSERT_MEMORY, self._memory_params(memory))
+            
+            self.logger.info("Memory stored", memory_id=memory.id, content_length=len(memory.content))
+            return memory.id
                 
         except Exception as e:
             self.logger.error("Failed to store memory", error=str(e))
             raise
     
+    async def store_memories_batch(self, memories: List[MemoryNode]) -> List[str]:
+        """Store several memory nodes in a single transaction."""
+        await self._ensure_initialized()
+        rows = [self._memory_params(memory) for memory in memories]
+        
+        def insert_all(conn: sqlite3.Connection) -> None:
+            # One commit for the whole batch instead of one per memory
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(_SQL_INSERT_MEMORY, rows)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        
+        try:
+            await self._run(insert_all)
+            
+            self.logger.info("Memories stored", count=len(rows))
+            return [memory.id for memory in memories]
+                
+        except Exception as e:
+            self.logger.error("Failed to store memories", count=len(rows), error=str(e))
+            raise
+    
     async def get_memory(self, memory_id: str) -> Optional[MemoryNode]:
         """Retrieve a memory node by ID and update access statistics."""
         await self._ensure_initialized()
         try:
-            async with aiosqlite.connect(self.db_path) as conn:
-                cursor = await conn.cursor()
-                await cursor.execute("SELECT * FROM memory_nodes WHERE id = ?", (memory_id,))
-                row = await cursor.fetchone()
-                
-                if row:
-                    # Update access statistics
-                    now = datetime.now(timezone.utc)
-                    await cursor.execute("""
-                        UPDATE memory_nodes 
-                        SET last_accessed_at = ?, access_count = access_count + 1
-                        WHERE id = ?
-                    """, (now.isoformat(), memory_id))
-                    await conn.commit()
-                    
-                    memory = MemoryNode(
-                        id=row[0],
-                        content=row[1],
-                        context=json.loads(row[2]) if row[2] else {},
-                        created_at=datetime.fromisoformat(row[3]),
-                        last_accessed_at=now,
-                        access_count=row[5] + 1,
-                        priority_score=row[6],
-                        node_type=row[7]
-                    )
-                    
-                    self.logger.info("Memory retrieved", memory_id=memory_id)
-                    return memory
+            # The access bump and the read are one statement, so no separate
+            # SELECT is needed and nothing can run between them. All rows are
+            # fetched so the statement completes and commits on the writer thread
+            rows = await self._run(lambda conn: conn.execute(f"""
+                UPDATE memory_nodes 
+                SET last_accessed_at = ?, access_count = access_count + 1
+                WHERE id = ?
+                RETURNING {_NODE_COLUMNS}
+            """, (_to_epoch_ms(datetime.now(timezone.utc)), memory_id)).fetchall())
+            
+            if rows:
+                memory = self._row_to_memory(rows[0])
                 
-                return None
+                self.logger.info("Memory retrieved", memory_id=memory_id)
+                return memory
+            
+            return None
                 
         except Exception as e:
             self.logger.error("Failed to retrieve memory", memory_id=memory_id, error=str(e))
             raise
     
-    async def search_memories(self, query: str, limit: int = 10) -> List[MemoryNode]:
-        """Search memories by content with priority ordering and improved JSON context search."""
+    async def record_accesses(self, accesses: List[Tuple[str, int, datetime]]) -> None:
+        """Apply ``(memory_id, access_count_delta, last_accessed_at)`` updates in one transaction."""
         await self._ensure_initialized()
+        rows = [(_to_epoch_ms(accessed_at), delta, memory_id) for memory_id, delta, accessed_at in accesses]
+        
+        def update_all(conn: sqlite3.Connection) -> None:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany("""
+                    UPDATE memory_nodes 
+                    SET last_accessed_at = ?, access_count = access_count + ?
+                    WHERE id = ?
+                """, rows)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        
         try:
-            async with aiosqlite.connect(self.db_path) as conn:
-                cursor = await conn.cursor()
-                
-                # Use improved search that handles JSON context more efficiently
-                # This searches content with LIKE and also checks if the query matches any JSON values
-                await cursor.execute("""
-                    SELECT * FROM memory_nodes 
-                    WHERE content LIKE ? 
-                       OR EXISTS (
-                           SELECT 1 FROM json_each(context) 
-                           WHERE json_each.value LIKE ?
-                       )
-                    ORDER BY priority_score DESC, last_accessed_at DESC
-                    LIMIT ?
-                """, (f"%{query}%", f"%{query}%", limit))
+            await self._run(update_all)
                 
-                memories = []
-                rows = await cursor.fetchall()
-                for row in rows:
-                    memory = MemoryNode(
-                        id=row[0],
-                        content=row[1],
-                        context=json.loads(row[2]) if row[2] else {},
-                        created_at=datetime.fromisoformat(row[3]),
-                        last_accessed_at=datetime.fromisoformat(row[4]),
-                        access_count=row[5],
-                        priority_score=row[6],
-                        node_type=row[7]
-                    )
-                    memories.append(memory)
+        except Exception as e:
+            self.logger.error("Failed to record memory accesses", count=len(rows), error=str(e))
+            raise
+    
+    @staticmethod
+    def _row_to_memory(row: sqlite3.Row) -> MemoryNode:
+        """Build a MemoryNode from a memory_nodes row selected with ``_NODE_COLUMNS``."""
+        fields = dict(row)
+        fields["context"] = orjson.loads(row["context"]) if row["context"] else {}
+        fields["created_at"] = _from_epoch_ms(row["created_at"])
+        fields["last_accessed_at"] = _from_epoch_ms(row["last_accessed_at"])
+        return MemoryNode(**fields)
+    
+    async def list_memories(self, limit: int = 10, newest_first: bool = False) -> List[MemoryNode]:
+        """List memories without any content matching.
+        
+        Memories are ordered by priority and last access, or by creation time when
+        ``newest_first`` is set.
+        """
+        await self._ensure_initialized()
+        order_by = "created_at DESC" if newest_first else "priority_score DESC, last_accessed_at DESC"
+        try:
+            rows = await self._fetchall(f"""
+                SELECT {_NODE_COLUMNS} FROM memory_nodes 
+                ORDER BY {order_by}
+                LIMIT ?
+            """, (limit,))
+            
+            return [self._row_to_memory(row) for row in rows]
                 
-                self.logger.info("Memory search completed", query=query, results_count=len(memories))
-                return memories
+        except Exception as e:
+            self.logger.error("Failed to list memories", error=str(e))
+            raise
+    
+    @staticmethod
+    def _search_statement(query: str, limit: int) -> Tuple[str, tuple]:
+        """Build the SQL and parameters that search memories for ``query``."""
+        if not query:
+            return f"""
+                SELECT {_NODE_COLUMNS} FROM memory_nodes 
+                ORDER BY priority_score DESC, last_accessed_at DESC
+                LIMIT ?
+            """, (limit,)
+        
+        if query.startswith("^") and len(query) > 1:
+            # Prefix mode: "^text" matches content starting with text, case-sensitively.
+            # GLOB metacharacters in the prefix are bracketed so they match literally
+            prefix = _GLOB_SPECIAL.sub(r"[\g<0>]", query[1:])
+            return f"""
+                SELECT {_NODE_COLUMNS} FROM memory_nodes 
+                WHERE content GLOB ? || '*'
+                ORDER BY priority_score DESC, last_accessed_at DESC
+                LIMIT ?
+            """, (prefix, limit)
+        
+        if len(query) >= 3:
+            # Quoted as one FTS5 phrase, so the query is matched as a plain substring
+            phrase = '"' + query.replace('"', '""') + '"'
+            return f"""
+                SELECT {_NODE_COLUMNS} FROM memory_nodes 
+                WHERE rowid IN (
+                    SELECT rowid FROM memory_nodes_fts WHERE memory_nodes_fts MATCH ?
+                )
+                ORDER BY priority_score DESC, last_accessed_at DESC
+                LIMIT ?
+            """, (phrase, limit)
+        
+        # Trigrams cannot match one- or two-character queries, so scan instead.
+        # This searches content with LIKE and also checks if the query matches any JSON values;
+        # the numbered parameter lets both LIKEs share one pattern
+        return f"""
+            SELECT {_NODE_COLUMNS} FROM memory_nodes 
+            WHERE content LIKE ?1 
+               OR EXISTS (
+                   SELECT 1 FROM json_each(context) 
+                   WHERE json_each.value LIKE ?1
+               )
+            ORDER BY priority_score DESC, last_accessed_at DESC
+            LIMIT ?2
+        """, (f"%{query}%", limit)
+    
+    @staticmethod
+    def _content_preview(preview_length: Optional[int]) -> Tuple[str, tuple]:
+        """Build the SQL expression and parameters that select content, cut to ``preview_length``."""
+        if preview_length is None:
+            return "content", ()
+        return "substr(content, 1, ?)", (preview_length,)
+    
+    async def search_memories(self, query: str, limit: int = 10) -> List[MemoryNode]:
+        """Search memories by content with priority ordering and improved JSON context search.
+        
+        An empty query matches every memory, so it is served by ``list_memories``.
+        A query starting with ``^`` matches memories whose content starts with the rest.
+        """
+        if not query:
+            return await self.list_memories(limit)
+        
+        await self._ensure_initialized()
+        try:
+            sql, params = self._search_statement(query, limit)
+            rows = await self._fetchall(sql, params)
+            
+            memories = [self._row_to_memory(row) for row in rows]
+            
+            self.logger.info("Memory search completed", query=query, results_count=len(memories))
+            return memories
                 
         except Exception as e:
             self.logger.error("Failed to search memories", query=query, error=str(e))
             raise
     
-    async def get_memory_stats(self) -> Dict[str, Any]:
-        """Get database statistics for health checks."""
+    async def iter_search_rows(self, query: str, limit: int = 10) -> AsyncIterator[sqlite3.Row]:
+        """Search like ``search_memories``, yielding raw rows as they are read.
+        
+        Rows are fetched in batches of ``STREAM_BATCH_SIZE`` from one reader
+        connection, which is held until the iteration finishes.
+        """
         await self._ensure_initialized()
+        sql, params = self._search_statement(query, limit)
+        loop = asyncio.get_running_loop()
+        conn = await loop.run_in_executor(self._reader_executor, self._acquire_reader)
+        cursor = None
         try:
-            async with aiosqlite.connect(self.db_path) as conn:
-                cursor = await conn.cursor()
+            cursor = await loop.run_in_executor(self._reader_executor, conn.execute, sql, params)
+            while True:
+                rows = await loop.run_in_executor(self._reader_executor, cursor.fetchmany, self.STREAM_BATCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row
+                    
+        except Exception as e:
+            self.logger.error("Failed to search memories", query=query, error=str(e))
+            raise
+        finally:
+            if cursor is not None:
+                # Closing ends the cursor's read transaction before the connection is reused
+                await loop.run_in_executor(self._reader_executor, cursor.close)
+            self._release_reader(conn)
+    
+    async def warm_up(self) -> None:
+        """Read the table, index and full-text pages a first search needs into cache.
+        
+        One pass runs per reader thread at once, which also opens the reader pool, so a
+        burst of concurrent first reads does not each wait on connecting.
+        """
+        await self._ensure_initialized()
+        # Each pass keeps its connection until every pass has one, so no two share a
+        # connection and the whole pool is opened
+        all_connected = threading.Barrier(self.READER_COUNT, timeout=5)
+        
+        def touch_pages(conn: sqlite3.Connection) -> None:
+            conn.execute("SELECT COUNT(*), MIN(rowid), MAX(rowid) FROM memory_nodes").fetchone()
+            conn.execute(f"""
+                SELECT {_NODE_COLUMNS} FROM memory_nodes 
+                ORDER BY priority_score DESC, last_accessed_at DESC
+                LIMIT 1
+            """).fetchone()
+            conn.execute("SELECT 1 FROM memory_nodes_fts WHERE memory_nodes_fts MATCH 'warmup' LIMIT 1").fetchone()
+            try:
+                all_connected.wait()
+            except threading.BrokenBarrierError:
+                # Another pass could not get a thread in time; this one is still warm
+                pass
+        
+        try:
+            await asyncio.gather(*(self._read(touch_pages) for _ in range(self.READER_COUNT)))
+            self.logger.info("Database cache warmed", readers=self._readers.qsize())
                 
-                await cursor.execute("SELECT COUNT(*) FROM memory_nodes")
-                result = await cursor.fetchone()
-                memory_count = result[0]
+        except Exception as e:
+            # Warming is only an optimization, so a failure here is not fatal
+            self.logger.warning("Failed to warm database cache", error=str(e))
+    
+    async def get_memory_stats(self, exact: bool = False) -> Dict[str, Any]:
+        """Get database statistics for health checks.
+        
+        Counts come from the trigger-maintained ``memory_counts`` table; ``exact``
+        recounts the tables instead.
+        """
+        await self._ensure_initialized()
+        try:
+            memory_count, relationship_count = await self._fetchone(
+                _SQL_EXACT_COUNTS if exact else _SQL_TRACKED_COUNTS
+            )
+            
+            return {
+                "memory_count": memory_count,
+                "relationship_count": relationship_count,
+                "graph_size": memory_count + relationship_count
+            }
                 
-                await cursor.execute("SELECT COUNT(*) FROM memory_relationships")
-                result = await cursor.fetchone()
-                relationship_count = result[0]
+        except Exception as e:
+            self.logger.error("Failed to get memory stats", error=str(e))
+            raise
+    
+    async def get_overview_summary(self, recent_limit: int = 5, preview_length: Optional[int] = None) -> Dict[str, Any]:
+        """Get the memory counts and the top memories' content in one statement.
+        
+        With ``preview_length``, only that many leading characters of each content are read.
+        """
+        await self._ensure_initialized()
+        content_sql, content_params = self._content_preview(preview_length)
+        try:
+            # The LEFT JOIN keeps a row carrying the counts even when there are no memories
+            rows = await self._fetchall(f"""
+                WITH recent AS (
+                    SELECT ROW_NUMBER() OVER (ORDER BY priority_score DESC, last_accessed_at DESC) AS rank,
+                           {content_sql} AS content
+                    FROM memory_nodes 
+                    ORDER BY priority_score DESC, last_accessed_at DESC
+                    LIMIT ?
+                )
+                SELECT (SELECT n FROM memory_counts WHERE name = 'memory_nodes') AS memory_count,
+                       (SELECT n FROM memory_counts WHERE name = 'memory_relationships') AS relationship_count,
+                       recent.content
+                FROM (SELECT 1) LEFT JOIN recent
+                ORDER BY recent.rank
+            """, (*content_params, recent_limit))
+            
+            memory_count = rows[0]["memory_count"]
+            relationship_count = rows[0]["relationship_count"]
+            return {
+                "memory_count": memory_count,
+                "relationship_count": relationship_count,
+                "graph_size": memory_count + relationship_count,
+                "recent_contents": [row["content"] for row in rows if row["content"] is not None]
+            }
                 
-                return {
-                    "memory_count": memory_count,
-                    "relationship_count": relationship_count,
-                    "graph_size": memory_count + relationship_count
-                }
+        except Exception as e:
+            self.logger.error("Failed to get overview summary", error=str(e))
+            raise
+    
+    async def get_topic_summary(self, query: str, limit: int = 50, top_count: int = 10,
+                                preview_length: Optional[int] = None) -> Dict[str, Any]:
+        """Summarize the memories matching ``query`` in one statement.
+        
+        Returns how many of the first ``limit`` matches there are, the content of the
+        top ``top_count`` (cut to ``preview_length`` characters if given), and each
+        context key's distinct values in order of first appearance.
+        """
+        await self._ensure_initialized()
+        search_sql, search_params = self._search_statement(query, limit)
+        content_sql, content_params = self._content_preview(preview_length)
+        try:
+            # One rowset with three kinds of rows: the match count, the top matches,
+            # and every distinct context (key, value) pair ranked by first appearance
+            rows = await self._fetchall(f"""
+                WITH matched AS ({search_sql}),
+                ranked AS (
+                    SELECT ROW_NUMBER() OVER (ORDER BY priority_score DESC, last_accessed_at DESC) AS rank,
+                           {content_sql} AS content, context
+                    FROM matched
+                ),
+                pairs AS (
+                    SELECT ranked.rank, entry.id AS position, entry.key, entry.value, entry.type
+                    FROM ranked, json_each(ranked.context) AS entry
+                )
+                SELECT 'count' AS kind, COUNT(*) AS ord, NULL AS name, NULL AS value, NULL AS type FROM ranked
+                UNION ALL
+                SELECT 'top', rank, content, NULL, NULL FROM ranked WHERE rank <= ?
+                UNION ALL
+                SELECT 'tag', MIN(rank * 1000000 + position), key, value, type FROM pairs GROUP BY key, value, type
+                ORDER BY kind, ord
+            """, (*search_params, *content_params, top_count))
+            
+            summary = {"match_count": 0, "top_contents": []}
+            context_values: Dict[str, List[Any]] = defaultdict(list)
+            for row in rows:
+                if row["kind"] == "count":
+                    summary["match_count"] = row["ord"]
+                elif row["kind"] == "top":
+                    summary["top_contents"].append(row["name"])
+                else:
+                    context_values[row["name"]].append(_decode_json_value(row["value"], row["type"]))
+            summary["context_values"] = dict(context_values)
+            return summary
                 
         except Exception as e:
-            self.logger.error("Failed to get memory stats", error=str(e))
+            self.logger.error("Failed to get topic summary", query=query, error=str(e))
+            raise
+    
+    async def get_type_distribution(self) -> Dict[str, int]:
+        """Count memories per node type."""
+        await self._ensure_initialized()
+        try:
+            rows = await self._fetchall("""
+                SELECT node_type, COUNT(*) as count 
+                FROM memory_nodes 
+                GROUP BY node_type
+            """)
+            return dict(rows)
+                
+        except Exception as e:
+            self.logger.error("Failed to get type distribution", error=str(e))
             raise
     
     async def search_by_context(self, context_filter: Dict[str, Any], limit: int = 10) -> List[Dict[str, Any]]:
         """Search memories by context criteria."""
         await self._ensure_initialized()
         try:
-            async with aiosqlite.connect(self.db_path) as conn:
-                cursor = await conn.cursor()
-                
-                # Build dynamic WHERE clause for JSON context search
-                conditions = []
-                params = []
-                
-                for key, value in context_filter.items():
+            # Build dynamic WHERE clause for JSON context search
+            conditions = []
+            params = []
+            
+            for key, value in context_filter.items():
+                if key in _INDEXED_CONTEXT_KEYS:
+                    conditions.append(f"json_extract(context, '$.{key}') = ?")
+                    params.append(value)
+                else:
                     conditions.append("json_extract(context, ?) = ?")
                     params.extend([f'$.{key}', value])
-                
-                where_clause = " AND ".join(conditions) if conditions else "1=1"
-                
-                await cursor.execute(f"""
-                    SELECT * FROM memory_nodes 
-                    WHERE {where_clause}
-                    ORDER BY priority_score DESC, last_accessed_at DESC
-                    LIMIT ?
-                """, params + [limit])
-                
-                memories = []
-                rows = await cursor.fetchall()
-                for row in rows:
-                    memories.append({
-                        "id": row[0],
-                        "content": row[1],
-                        "context": json.loads(row[2]) if row[2] else {},
-                        "created_at": row[3],
-                        "last_accessed_at": row[4],
-                        "access_count": row[5],
-                        "priority_score": row[6],
-                        "node_type": row[7]
-                    })
-                
-                return memories
+            
+            where_clause = " AND ".join(conditions) if conditions else "1=1"
+            
+            rows = await self._fetchall(f"""
+                SELECT {_NODE_COLUMNS} FROM memory_nodes 
+                WHERE {where_clause}
+                ORDER BY priority_score DESC, last_accessed_at DESC
+                LIMIT ?
+            """, params + [limit])
+            
+            memories = []
+            for row in rows:
+                memory = dict(row)
+                memory["context"] = orjson.loads(row["context"]) if row["context"] else {}
+                memory["created_at"] = _from_epoch_ms(row["created_at"]).isoformat()
+                memory["last_accessed_at"] = _from_epoch_ms(row["last_accessed_at"]).isoformat()
+                memories.append(memory)
+            
+            return memories
                 
         except Exception as e:
             self.logger.error("Failed to search by context", context_filter=context_filter, error=str(e))
             raise
 
-
 class MemoryCore:
     """Core memory management system."""
     
+    RECALL_CACHE_SIZE = 1024
+    # Seconds that access-count updates for cached recalls are held before being written
+    ACCESS_FLUSH_INTERVAL = 1.0
+    
     def __init__(self, db_path: str = "memory_graph.db"):
         self.db = MemoryDatabase(db_path)
         self.logger = structlog.get_logger().bind(component="memory_core")
+        # Bumped on every store, so callers can tell whether cached results are stale
+        self.write_version = 0
+        
+        # Recently recalled memories by ID, least recently used first. Only the access
+        # statistics of a memory change after it is stored; on a cache hit they are
+        # bumped here and queued in _pending_accesses as (count, last accessed)
+        self._recall_cache: "OrderedDict[str, MemoryNode]" = OrderedDict()
+        self._pending_accesses: Dict[str, Tuple[int, datetime]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
         
     async def store_memory(self, content: str, context: Optional[Dict[str, Any]] = None) -> str:
         """Store a new memory with optional context."""
@@ -327,29 +878,112 @@ class MemoryCore:
         )
         
         memory_id = await self.db.store_memory(memory)
+        self.write_version += 1
         self.logger.info("Memory stored via core", memory_id=memory_id)
         return memory_id
     
+    async def store_memories_batch(self, items: List[Dict[str, Any]]) -> List[str]:
+        """Store several memories at once; each item has ``content`` and optional ``context``."""
+        memories = [
+            MemoryNode(content=item["content"], context=item.get("context") or {})
+            for item in items
+        ]
+        
+        memory_ids = await self.db.store_memories_batch(memories)
+        self.write_version += 1
+        self.logger.info("Memories stored via core", count=len(memory_ids))
+        return memory_ids
+    
+    @staticmethod
+    def _format_result(memory: MemoryNode) -> Dict[str, Any]:
+        """Format a memory node as a query result."""
+        return {
+            "id": memory.id,
+            "content": memory.content,
+            "context": memory.context,
+            "created_at": memory.created_at.isoformat(),
+            "priority_score": memory.priority_score,
+            "node_type": memory.node_type
+        }
+    
+    @classmethod
+    def _format_results(cls, memories: List[MemoryNode]) -> List[Dict[str, Any]]:
+        """Format memory nodes as query results."""
+        return [cls._format_result(memory) for memory in memories]
+    
     async def query_memories(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Query memories and return formatted results."""
         memories = await self.db.search_memories(query, limit)
+        return self._format_results(memories)
+    
+    async def iter_query_rows(self, query: str, limit: int = 10) -> AsyncIterator[Tuple[str, str, Dict[str, Any], str, float]]:
+        """Query memories, yielding ``(id, content, context, created_at, priority_score)`` tuples.
         
-        results = []
-        for memory in memories:
-            results.append({
-                "id": memory.id,
-                "content": memory.content,
-                "context": memory.context,
-                "created_at": memory.created_at.isoformat(),
-                "priority_score": memory.priority_score,
-                "node_type": memory.node_type
-            })
+        Rows are yielded as they are read, and no MemoryNode or result dict is built
+        for them, for callers that only format these fields.
+        """
+        async for row in self.db.iter_search_rows(query, limit):
+            context = row["context"]
+            yield (
+                row["id"],
+                row["content"],
+                orjson.loads(context) if context and context != "{}" else {},
+                _from_epoch_ms(row["created_at"]).isoformat(),
+                row["priority_score"]
+            )
+    
+    async def list_recent(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """List memories in priority and recency order, skipping content search."""
+        memories = await self.db.list_memories(limit)
+        return self._format_results(memories)
+    
+    async def recent_memories(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """List the most recently created memories."""
+        memories = await self.db.list_memories(limit, newest_first=True)
+        return self._format_results(memories)
+    
+    def _queue_access(self, memory: MemoryNode) -> None:
+        """Count an access to a cached memory and schedule it to be written."""
+        now = datetime.now(timezone.utc)
+        memory.access_count += 1
+        memory.last_accessed_at = now
+        
+        count, _ = self._pending_accesses.get(memory.id, (0, now))
+        self._pending_accesses[memory.id] = (count + 1, now)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_accesses_later())
+    
+    async def _flush_accesses_later(self):
+        """Write queued accesses after ``ACCESS_FLUSH_INTERVAL``."""
+        try:
+            await asyncio.sleep(self.ACCESS_FLUSH_INTERVAL)
+        finally:
+            # Also runs when the task is cancelled at shutdown, so queued accesses are kept
+            self._flush_task = None
+            await self.flush_accesses()
+    
+    async def flush_accesses(self):
+        """Write every queued access to the database in one transaction."""
+        if not self._pending_accesses:
+            return
         
-        return results
+        pending, self._pending_accesses = self._pending_accesses, {}
+        await self.db.record_accesses([
+            (memory_id, count, accessed_at) for memory_id, (count, accessed_at) in pending.items()
+        ])
     
     async def recall_memory(self, memory_id: str) -> Optional[Dict[str, Any]]:
-        """Recall a specific memory by ID."""
-        memory = await self.db.get_memory(memory_id)
+        """Recall a specific memory by ID, serving repeat lookups from the recall cache."""
+        memory = self._recall_cache.get(memory_id)
+        if memory is None:
+            memory = await self.db.get_memory(memory_id)
+            if memory:
+                self._recall_cache[memory_id] = memory
+                if len(self._recall_cache) > self.RECALL_CACHE_SIZE:
+                    self._recall_cache.popitem(last=False)
+        else:
+            self._recall_cache.move_to_end(memory_id)
+            self._queue_access(memory)
         
         if memory:
             return {
@@ -380,20 +1014,11 @@ class MemoryCore:
         stats = await self.db.get_memory_stats()
         
         # Get recent memories
-        recent_memories = await self.query_memories("", limit=5)
+        recent_memories = await self.list_recent(5)
         
         # Get memory types distribution
         try:
-            async with aiosqlite.connect(self.db.db_path) as conn:
-                cursor = await conn.cursor()
-                await cursor.execute("""
-                    SELECT node_type, COUNT(*) as count 
-                    FROM memory_nodes 
-                    GROUP BY node_type
-                """)
-                type_distribution = {}
-                async for row in cursor:
-                    type_distribution[row[0]] = row[1]
+            type_distribution = await self.db.get_type_distribution()
         except Exception:
             type_distribution = {}
         
@@ -412,9 +1037,24 @@ class MemoryCore:
             ]
         }
     
-    async def get_health_status(self) -> Dict[str, Any]:
-        """Get system health and statistics."""
-        stats = await self.db.get_memory_stats()
+    async def get_overview_summary(self, recent_limit: int = 5, preview_length: Optional[int] = None) -> Dict[str, Any]:
+        """Get memory counts and the top memories' content in a single query."""
+        summary = await self.db.get_overview_summary(recent_limit, preview_length)
+        summary["db_path"] = self.db.db_path
+        return summary
+    
+    async def get_topic_summary(self, topic: str, limit: int = 50, top_count: int = 10,
+                                preview_length: Optional[int] = None) -> Dict[str, Any]:
+        """Summarize the memories related to a topic in a single query."""
+        return await self.db.get_topic_summary(topic, limit, top_count, preview_length)
+    
+    async def warm_up(self):
+        """Preload the database pages used by the first queries."""
+        await self.db.warm_up()
+    
+    async def get_health_status(self, exact: bool = False) -> Dict[str, Any]:
+        """Get system health and statistics; ``exact`` recounts rather than reading the tracked counts."""
+        stats = await self.db.get_memory_stats(exact)
         
         return {
             "status": "healthy",
@@ -422,6 +1062,14 @@ class MemoryCore:
             "graph_size": stats["graph_size"],
             "db_path": self.db.db_path
         }
+    
+    async def close(self):
+        """Write queued accesses and release the database connection."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush_accesses()
+        await self.db.close()
 
 
 if __name__ == "__main__":
@@ -453,5 +1101,7 @@ if __name__ == "__main__":
         # Health check
         health = await core.get_health_status()
         print(f"\nHealth status: {health}")
+        
+        await core.close()
     
     asyncio.run(test_memory_core())
\ No newline at end of file
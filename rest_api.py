@@ -6,29 +6,58 @@ This server provides MCP protocol over HTTP Server-Sent Events (SSE) for web com
 
 import asyncio
 import json
+import logging
 import os
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 import structlog
 from fastmcp import FastMCP, Context
+from starlette.requests import Request
+from starlette.responses import Response
 
 from memory_core import MemoryCore
 
 logger = structlog.get_logger()
 
 
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON text with orjson, optionally pretty-printed."""
+    option = orjson.OPT_INDENT_2 if indent else 0
+    return orjson.dumps(obj, default=str, option=option).decode()
+
+
 class FastMCPMemoryServer:
     """FastMCP Memory Server - MCP over HTTP with SSE."""
     
-    def __init__(self, db_path: str = "memory_graph.db"):
-        self.memory_core = MemoryCore(db_path)
+    # Seconds the memory://overview resource is served from cache; a store invalidates it sooner
+    OVERVIEW_CACHE_TTL = 0.5
+    # Seconds a health status is reused, absorbing bursts of probes; a store invalidates it sooner
+    HEALTH_CACHE_TTL = 1.0
+    # Search tool results kept for repeated queries; like the overview, a store invalidates them
+    QUERY_CACHE_SIZE = 512
+    QUERY_CACHE_TTL = 0.5
+    
+    def __init__(self, db_path: str = "memory_graph.db", memory_core: Optional[MemoryCore] = None):
+        self.memory_core = memory_core if memory_core is not None else MemoryCore(db_path)
         self.logger = structlog.get_logger().bind(component="fastmcp_server")
+        # (cached_at, memory_core.write_version, overview JSON)
+        self._overview_cache: Optional[Tuple[float, int, str]] = None
+        # (cached_at, memory_core.write_version, health status)
+        self._health_cache: Optional[Tuple[float, int, Dict[str, Any]]] = None
+        # (tool, query, limit) -> (cached_at, memory_core.write_version, result text),
+        # least recently used first
+        self._query_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, int, str]]" = OrderedDict()
+        self._warm_task: Optional[asyncio.Task] = None
         
         # Initialize FastMCP server
         self.app = FastMCP("Memory MCP Server")
         self._setup_tools()
         self._setup_resources()
         self._setup_prompts()
+        self._setup_routes()
     
     def _setup_tools(self):
         """Set up memory management tools."""
@@ -44,28 +73,43 @@ class FastMCPMemoryServer:
             
             return f"✓ Memory stored successfully with ID: {memory_id}"
         
+        @self.app.tool()
+        async def store_memories_batch(memories: List[Dict[str, Any]]) -> str:
+            """Store several memories at once; each item has content and optional context."""
+            memory_ids = await self.memory_core.store_memories_batch(memories)
+            self.logger.info("Memories stored via FastMCP", count=len(memory_ids))
+            
+            parts = [f"✓ Stored {len(memory_ids)} memories:\n"]
+            parts.extend(f"- {memory_id}\n" for memory_id in memory_ids)
+            return "".join(parts)
+        
         @self.app.tool()
         async def query_memories(query: str, limit: int = 10) -> str:
             """Search for memories based on content or context."""
             if limit < 1 or limit > 100:
                 limit = min(max(limit, 1), 100)
             
+            cache_key = ("query_memories", query, limit)
+            cached = self._cached_result(cache_key)
+            if cached is not None:
+                return cached
+            
             memories = await self.memory_core.query_memories(query, limit)
             
             if not memories:
-                return f"No memories found for query: '{query}'"
+                return self._cache_result(cache_key, f"No memories found for query: '{query}'")
             
-            response = f"Found {len(memories)} memories for '{query}':\n\n"
+            parts = [f"Found {len(memories)} memories for '{query}':\n\n"]
             for i, memory in enumerate(memories, 1):
-                response += f"{i}. {memory['content']}\n"
-                response += f"   ID: {memory['id']}\n"
-                response += f"   Priority: {memory['priority_score']:.2f}\n"
+                parts.append(f"{i}. {memory['content']}\n")
+                parts.append(f"   ID: {memory['id']}\n")
+                parts.append(f"   Priority: {memory['priority_score']:.2f}\n")
                 if memory['context']:
-                    response += f"   Context: {json.dumps(memory['context'])}\n"
-                response += "\n"
+                    parts.append(f"   Context: {json.dumps(memory['context'])}\n")
+                parts.append("\n")
             
             self.logger.info("Memory search via FastMCP", query=query, results=len(memories))
-            return response
+            return self._cache_result(cache_key, "".join(parts))
         
         @self.app.tool()
         async def recall_memory(memory_id: str) -> str:
@@ -75,83 +119,141 @@ class FastMCPMemoryServer:
             if not memory:
                 return f"Memory with ID '{memory_id}' not found."
             
-            response = f"Memory ID: {memory['id']}\n"
-            response += f"Content: {memory['content']}\n"
-            response += f"Created: {memory['created_at']}\n"
-            response += f"Last Accessed: {memory['last_accessed_at']}\n"
-            response += f"Access Count: {memory['access_count']}\n"
-            response += f"Priority Score: {memory['priority_score']:.2f}\n"
-            response += f"Type: {memory['node_type']}\n"
+            parts = [
+                f"Memory ID: {memory['id']}\n",
+                f"Content: {memory['content']}\n",
+                f"Created: {memory['created_at']}\n",
+                f"Last Accessed: {memory['last_accessed_at']}\n",
+                f"Access Count: {memory['access_count']}\n",
+                f"Priority Score: {memory['priority_score']:.2f}\n",
+                f"Type: {memory['node_type']}\n"
+            ]
             if memory['context']:
-                response += f"Context: {json.dumps(memory['context'], indent=2)}\n"
+                parts.append(f"Context: {_dumps(memory['context'], indent=True)}\n")
             
             self.logger.info("Memory recalled via FastMCP", memory_id=memory_id)
-            return response
+            return "".join(parts)
         
         @self.app.tool()
         async def get_knowledge_overview(topic: Optional[str] = None) -> str:
             """Get an overview of stored knowledge and memories."""
             if topic:
-                # Search for memories related to the topic
-                memories = await self.memory_core.query_memories(topic, 50)
-                response = f"Knowledge Overview for '{topic}':\n\n"
+                cache_key = ("get_knowledge_overview", topic, 50)
+                cached = self._cached_result(cache_key)
+                if cached is not None:
+                    return cached
                 
-                if memories:
-                    # Analyze context types
-                    context_types = {}
-                    for memory in memories:
-                        for key, value in memory.get('context', {}).items():
-                            if key not in context_types:
-                                context_types[key] = set()
-                            context_types[key].add(str(value))
-                    
-                    response += f"📋 Found {len(memories)} related memories\n"
-                    for key, values in context_types.items():
-                        response += f"🏷️ {key.title()}: {', '.join(list(values)[:5])}\n"
+                # Counts, top memories and context values for the topic come back from
+                # one query, with the top memories already cut to their 80 character preview
+                summary = await self.memory_core.get_topic_summary(topic, 50, 10, 80)
+                parts = [f"Knowledge Overview for '{topic}':\n\n"]
+                
+                if summary["match_count"]:
+                    parts.append(f"📋 Found {summary['match_count']} related memories\n")
+                    for key, values in summary["context_values"].items():
+                        # Distinct by displayed text, keeping the first five seen
+                        shown = list(dict.fromkeys(str(value) for value in values))[:5]
+                        parts.append(f"🏷️ {key.title()}: {', '.join(shown)}\n")
                     
-                    response += "\nTop Memories:\n"
-                    for i, memory in enumerate(memories[:10], 1):
-                        response += f"{i}. {memory['content'][:80]}...\n"
+                    parts.append("\nTop Memories:\n")
+                    for i, content in enumerate(summary["top_contents"], 1):
+                        parts.append(f"{i}. {content}...\n")
                 else:
-                    response += f"No memories found related to '{topic}'"
+                    parts.append(f"No memories found related to '{topic}'")
             else:
-                # Get general overview
-                health = await self.memory_core.get_health_status()
-                response = f"Knowledge Base Overview:\n\n"
-                response += f"📊 Total Memories: {health['memory_count']}\n"
-                response += f"🔗 Graph Size: {health['graph_size']}\n"
-                response += f"💾 Database: {health['db_path']}\n\n"
+                # Get general overview; counts and recent memories come back from one query
+                summary = await self.memory_core.get_overview_summary(5, 100)
+                parts = [
+                    "Knowledge Base Overview:\n\n",
+                    f"📊 Total Memories: {summary['memory_count']}\n",
+                    f"🔗 Graph Size: {summary['graph_size']}\n",
+                    f"💾 Database: {summary['db_path']}\n\n"
+                ]
                 
-                # Get recent memories
-                recent_memories = await self.memory_core.query_memories("", 5)
-                if recent_memories:
-                    response += "Recent Memories:\n"
-                    for memory in recent_memories:
-                        response += f"- {memory['content'][:100]}...\n"
+                if summary["recent_contents"]:
+                    parts.append("Recent Memories:\n")
+                    for content in summary["recent_contents"]:
+                        parts.append(f"- {content}...\n")
             
             self.logger.info("Knowledge overview requested via FastMCP", topic=topic)
-            return response
+            text = "".join(parts)
+            if topic:
+                self._cache_result(cache_key, text)
+            return text
         
         @self.app.tool()
         async def exhaustive_search(query: str) -> str:
             """Perform a comprehensive search across all memories."""
-            # Perform broader search with higher limit
-            memories = await self.memory_core.query_memories(query, 100)
+            cache_key = ("exhaustive_search", query, 100)
+            cached = self._cached_result(cache_key)
+            if cached is not None:
+                return cached
             
-            response = f"Exhaustive Search Results for '{query}':\n\n"
-            response += f"Found {len(memories)} total memories\n\n"
+            # Perform broader search with higher limit, formatting each memory as it
+            # is read; the count line is filled in once the results are exhausted
+            parts = [f"Exhaustive Search Results for '{query}':\n\n", ""]
             
-            for i, memory in enumerate(memories, 1):
-                response += f"{i}. {memory['content']}\n"
-                response += f"   ID: {memory['id']}\n"
-                response += f"   Priority: {memory['priority_score']:.2f}\n"
-                response += f"   Created: {memory['created_at']}\n"
-                if memory['context']:
-                    response += f"   Context: {json.dumps(memory['context'])}\n"
-                response += "\n"
+            count = 0
+            async for memory_id, content, context, created_at, priority in self.memory_core.iter_query_rows(query, 100):
+                count += 1
+                parts.append(
+                    f"{count}. {content}\n"
+                    f"   ID: {memory_id}\n"
+                    f"   Priority: {priority:.2f}\n"
+                    f"   Created: {created_at}\n"
+                )
+                if context:
+                    parts.append(f"   Context: {json.dumps(context)}\n")
+                parts.append("\n")
             
-            self.logger.info("Exhaustive search via FastMCP", query=query, results=len(memories))
-            return response
+            parts[1] = f"Found {count} total memories\n\n"
+            
+            self.logger.info("Exhaustive search via FastMCP", query=query, results=count)
+            return self._cache_result(cache_key, "".join(parts))
+    
+    def _setup_routes(self):
+        """Set up plain HTTP routes served beside the MCP endpoint."""
+        
+        @self.app.custom_route("/health", methods=["GET"])
+        async def http_health(request: Request) -> Response:
+            """Answer load balancer and monitoring probes without an MCP session."""
+            health = await self._health_status()
+            return Response(orjson.dumps(health), media_type="application/json")
+    
+    async def _health_status(self) -> Dict[str, Any]:
+        """Get the health status, reusing one fetched within ``HEALTH_CACHE_TTL``."""
+        now = time.monotonic()
+        version = self.memory_core.write_version
+        if self._health_cache is not None:
+            cached_at, cached_version, health = self._health_cache
+            if cached_version == version and now - cached_at < self.HEALTH_CACHE_TTL:
+                return health
+        
+        health = await self.memory_core.get_health_status()
+        self._health_cache = (now, version, health)
+        return health
+    
+    def _cached_result(self, key: Tuple[str, str, int]) -> Optional[str]:
+        """Return a search tool's cached text if no store happened since and it is still fresh."""
+        entry = self._query_cache.get(key)
+        if entry is None:
+            return None
+        
+        cached_at, version, text = entry
+        if version != self.memory_core.write_version or time.monotonic() - cached_at >= self.QUERY_CACHE_TTL:
+            del self._query_cache[key]
+            return None
+        
+        self._query_cache.move_to_end(key)
+        return text
+    
+    def _cache_result(self, key: Tuple[str, str, int], text: str) -> str:
+        """Remember a search tool's text, evicting the least recently used entry when full."""
+        self._query_cache[key] = (time.monotonic(), self.memory_core.write_version, text)
+        self._query_cache.move_to_end(key)
+        if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return text
     
     def _setup_resources(self):
         """Set up memory resources."""
@@ -159,14 +261,24 @@ class FastMCPMemoryServer:
         @self.app.resource("memory://health")
         async def get_health() -> str:
             """Get system health status."""
-            health = await self.memory_core.get_health_status()
-            return json.dumps(health, indent=2)
+            health = await self._health_status()
+            return _dumps(health, indent=True)
         
         @self.app.resource("memory://overview")
         async def get_overview() -> str:
             """Get knowledge base overview."""
-            health = await self.memory_core.get_health_status()
-            recent_memories = await self.memory_core.query_memories("", 10)
+            now = time.monotonic()
+            version = self.memory_core.write_version
+            if self._overview_cache is not None:
+                cached_at, cached_version, cached_text = self._overview_cache
+                if cached_version == version and now - cached_at < self.OVERVIEW_CACHE_TTL:
+                    return cached_text
+            
+            # Independent reads, so they run on separate reader connections at once
+            health, recent_memories = await asyncio.gather(
+                self._health_status(),
+                self.memory_core.list_recent(10)
+            )
             
             overview = {
                 "total_memories": health["memory_count"],
@@ -183,7 +295,9 @@ class FastMCPMemoryServer:
                 ]
             }
             
-            return json.dumps(overview, indent=2)
+            text = _dumps(overview, indent=True)
+            self._overview_cache = (now, version, text)
+            return text
         
         @self.app.resource("memory://memory/{memory_id}")
         async def get_memory_by_id(memory_id: str) -> str:
@@ -191,9 +305,9 @@ class FastMCPMemoryServer:
             memory = await self.memory_core.recall_memory(memory_id)
             
             if not memory:
-                return json.dumps({"error": f"Memory with ID '{memory_id}' not found"})
+                return _dumps({"error": f"Memory with ID '{memory_id}' not found"})
             
-            return json.dumps(memory, indent=2)
+            return _dumps(memory, indent=True)
     
     def _setup_prompts(self):
         """Set up memory-related prompts."""
@@ -206,40 +320,51 @@ class FastMCPMemoryServer:
             if not memories:
                 return f"I don't have any specific memories about '{topic}'. Please provide context or ask me to learn about it."
             
-            prompt = f"Based on my memories about '{topic}', here's what I know:\n\n"
+            parts = [f"Based on my memories about '{topic}', here's what I know:\n\n"]
             for i, memory in enumerate(memories, 1):
-                prompt += f"{i}. {memory['content']}\n"
+                parts.append(f"{i}. {memory['content']}\n")
                 if memory['context']:
-                    prompt += f"   Context: {json.dumps(memory['context'])}\n"
-                prompt += "\n"
+                    parts.append(f"   Context: {json.dumps(memory['context'])}\n")
+                parts.append("\n")
             
-            prompt += f"Please use this context to respond about '{topic}'."
-            return prompt
+            parts.append(f"Please use this context to respond about '{topic}'.")
+            return "".join(parts)
         
         @self.app.prompt()
         async def summarize_knowledge_prompt() -> str:
             """Generate a prompt to summarize all stored knowledge."""
-            health = await self.memory_core.get_health_status()
-            recent_memories = await self.memory_core.query_memories("", 20)
+            health, recent_memories = await asyncio.gather(
+                self._health_status(),
+                self.memory_core.list_recent(20)
+            )
             
-            prompt = f"I have {health['memory_count']} memories stored in my knowledge base. "
-            prompt += "Here are some recent and important memories:\n\n"
+            parts = [
+                f"I have {health['memory_count']} memories stored in my knowledge base. ",
+                "Here are some recent and important memories:\n\n"
+            ]
             
             for i, memory in enumerate(recent_memories, 1):
-                prompt += f"{i}. {memory['content'][:150]}...\n"
-                prompt += f"   Priority: {memory['priority_score']:.2f}\n"
+                parts.append(f"{i}. {memory['content'][:150]}...\n")
+                parts.append(f"   Priority: {memory['priority_score']:.2f}\n")
                 if memory['context']:
-                    prompt += f"   Tags: {', '.join(memory['context'].keys())}\n"
-                prompt += "\n"
+                    parts.append(f"   Tags: {', '.join(memory['context'].keys())}\n")
+                parts.append("\n")
             
-            prompt += "Please provide a comprehensive summary of my knowledge base and suggest areas for improvement."
-            return prompt
+            parts.append("Please provide a comprehensive summary of my knowledge base and suggest areas for improvement.")
+            return "".join(parts)
+    
+    def _start_cache_warm_up(self):
+        """Warm the database cache in the background while the transport starts."""
+        if self._warm_task is None:
+            self._warm_task = asyncio.create_task(self.memory_core.warm_up())
     
     async def run_http_async(self, host: str = "0.0.0.0", port: int = 8080):
         """Run the FastMCP server with HTTP transport asynchronously."""
         self.logger.info("Starting FastMCP Memory Server with HTTP transport", host=host, port=port)
+        self._start_cache_warm_up()
         
-        # Use FastMCP's built-in async HTTP runner
+        # Use FastMCP's built-in async HTTP runner; uvicorn's "auto" loop and http
+        # settings select uvloop and httptools from uvicorn[standard]
         await self.app.run_streamable_http_async(host=host, port=port)
     
     def run_http(self, host: str = "0.0.0.0", port: int = 8080):
@@ -252,6 +377,7 @@ class FastMCPMemoryServer:
     async def run_stdio_async(self):
         """Run the FastMCP server with stdio transport asynchronously."""
         self.logger.info("Starting FastMCP Memory Server with stdio transport")
+        self._start_cache_warm_up()
         
         # Use FastMCP's built-in async stdio runner
         await self.app.run_stdio_async()
@@ -283,6 +409,9 @@ async def main():
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
+        # Calls below the root logger's level return at once, so the per-request info
+        # logs in the tools cost nothing unless that level is lowered
+        wrapper_class=structlog.make_filtering_bound_logger(logging.getLogger().getEffectiveLevel()),
         cache_logger_on_first_use=True,
     )
     
@@ -50,6 +50,8 @@ class MemoryMCPMain:
         self.logger = structlog.get_logger().bind(component="main")
         self.running = True
         self.services = []
+        # Shared by the health check and the server started on this event loop
+        self.memory_core = MemoryCore(self.config.db_path)
         
         # Configure logging based on config
         self._setup_logging()
@@ -82,7 +84,8 @@ class MemoryMCPMain:
             ],
             context_class=dict,
             logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
+            # Calls below the configured level return at once instead of running the processors
+            wrapper_class=structlog.make_filtering_bound_logger(log_level),
             cache_logger_on_first_use=True,
         )
         
@@ -102,14 +105,14 @@ class MemoryMCPMain:
         """Run the MCP server on stdio."""
         self.logger.info("Starting MCP server on stdio")
         
-        server = MCPMemoryServer(self.config.db_path)
+        server = MCPMemoryServer(self.config.db_path, memory_core=self.memory_core)
         await server.run_stdio()
     
     async def run_fastmcp_http(self):
         """Run the FastMCP server with HTTP transport."""
         self.logger.info("Starting FastMCP HTTP server", host=self.config.host, port=self.config.port)
         
-        server = FastMCPMemoryServer(self.config.db_path)
+        server = FastMCPMemoryServer(self.config.db_path, memory_core=self.memory_core)
         await server.run_http_async(self.config.host, self.config.port)
     
     def run_gradio_admin(self):
@@ -174,8 +177,7 @@ class MemoryMCPMain:
     async def health_check(self):
         """Perform initial health check."""
         try:
-            memory_core = MemoryCore(self.config.db_path)
-            health = await memory_core.get_health_status()
+            health = await self.memory_core.get_health_status()
             self.logger.info("Health check passed", **health)
             return True
         except Exception as e:
@@ -215,6 +217,8 @@ class MemoryMCPMain:
         except Exception as e:
             self.logger.error("Server error", error=str(e))
             return 1
+        finally:
+            await self.memory_core.close()
         
         return 0
 
@@ -10,19 +10,21 @@ functionality works correctly for LLM AI chatbots.
 import asyncio
 import json
 import tempfile
-import shutil
 import os
+import sqlite3
 from datetime import datetime, timezone
 from typing import Dict, Any, List
 
 from memory_core import MemoryCore
+from mcp_server import MCPMemoryServer
 
 class MemoryTestSuite:
     """Comprehensive test suite for memory operations."""
     
     def __init__(self):
-        # Use temporary directory for testing
-        self.test_dir = tempfile.mkdtemp()
+        # Use temporary directory for testing, on RAM-backed /dev/shm where there is one
+        self._scratch = tempfile.TemporaryDirectory(dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+        self.test_dir = self._scratch.name
         self.db_path = os.path.join(self.test_dir, "test_memory.db")
         self.memory_core = MemoryCore(self.db_path)
         self.test_results = []
@@ -66,7 +68,9 @@ class MemoryTestSuite:
     async def test_context_based_search(self):
         """Test context-based memory search."""
         try:
-            # Store memories with different contexts
+            # Store memories with different contexts, tagged so the counts below only
+            # see this test's memories while other tests store theirs concurrently
+            tag = {"suite_test": "context_based_search"}
             memories = [
                 ("Working on React project frontend", {"project": "webapp", "tech": "React", "role": "frontend"}),
                 ("Backend API uses Node.js", {"project": "webapp", "tech": "Node.js", "role": "backend"}),
@@ -74,16 +78,18 @@ class MemoryTestSuite:
                 ("Database optimization with PostgreSQL", {"project": "webapp", "tech": "PostgreSQL", "role": "database"})
             ]
             
-            stored_ids = []
-            for content, context in memories:
-                memory_id = await self.memory_core.store_memory(content, context)
-                stored_ids.append(memory_id)
+            stored_ids = await self.memory_core.store_memories_batch(
+                [{"content": content, "context": {**context, **tag}} for content, context in memories]
+            )
+            assert len(stored_ids) == len(memories), f"Expected {len(memories)} IDs, got {len(stored_ids)}"
             
             # Test context-based search
-            webapp_memories = await self.memory_core.search_by_context({"project": "webapp"})
+            webapp_memories = await self.memory_core.search_by_context({**tag, "project": "webapp"})
             assert len(webapp_memories) == 3, f"Expected 3 webapp memories, got {len(webapp_memories)}"
+            expected_ids = {stored_ids[0], stored_ids[1], stored_ids[3]}
+            assert {m["id"] for m in webapp_memories} == expected_ids, "Webapp search returned the wrong memories"
             
-            frontend_memories = await self.memory_core.search_by_context({"role": "frontend"})
+            frontend_memories = await self.memory_core.search_by_context({**tag, "role": "frontend"})
             assert len(frontend_memories) == 2, f"Expected 2 frontend memories, got {len(frontend_memories)}"
             
             self.log_result("Context-Based Search", True, f"Found {len(webapp_memories)} webapp memories")
@@ -95,18 +101,14 @@ class MemoryTestSuite:
         """Test content-based memory search."""
         try:
             # Store memories with searchable content
-            await self.memory_core.store_memory(
-                "User loves machine learning and AI research",
-                {"interest": "AI", "level": "advanced"}
-            )
-            await self.memory_core.store_memory(
-                "Completed machine learning course on Coursera",
-                {"achievement": "course", "topic": "ML"}
-            )
-            await self.memory_core.store_memory(
-                "Working on deep learning project with TensorFlow",
-                {"project": "deep_learning", "framework": "TensorFlow"}
-            )
+            await self.memory_core.store_memories_batch([
+                {"content": "User loves machine learning and AI research",
+                 "context": {"interest": "AI", "level": "advanced"}},
+                {"content": "Completed machine learning course on Coursera",
+                 "context": {"achievement": "course", "topic": "ML"}},
+                {"content": "Working on deep learning project with TensorFlow",
+                 "context": {"project": "deep_learning", "framework": "TensorFlow"}}
+            ])
             
             # Search for machine learning related memories
             ml_memories = await self.memory_core.query_memories("machine learning")
@@ -121,6 +123,117 @@ class MemoryTestSuite:
         except Exception as e:
             self.log_result("Content Search", False, str(e))
     
+    async def test_search_modes(self):
+        """Test that prefix, short and full-text queries return the expected memories."""
+        try:
+            # Marker words no other test stores
+            ids = await self.memory_core.store_memories_batch([
+                {"content": "Zyxwv prefix note", "context": {}},
+                {"content": "lowercase zyxwv note", "context": {}},
+                {"content": "Short marker \u00a4\u00a4 note", "context": {}},
+                {"content": "Plain note", "context": {"label": "Qwertz"}}
+            ])
+            
+            async def found(query: str) -> set:
+                return {memory["id"] for memory in await self.memory_core.query_memories(query, 50)}
+            
+            # "^" matches the start of content, case-sensitively
+            assert await found("^Zyxwv") == {ids[0]}, "Prefix search should match only the capitalized memory"
+            # Three or more characters go through the full-text index, matching any
+            # substring of content or context values regardless of case
+            assert await found("yxwv") == {ids[0], ids[1]}, "Full-text search should match both marker memories"
+            assert await found("qwertz") == {ids[3]}, "Full-text search should match context values"
+            # Shorter queries fall back to a LIKE scan
+            assert await found("\u00a4\u00a4") == {ids[2]}, "Short search should match the two-character marker"
+            
+            self.log_result("Search Modes", True, "Prefix, full-text and short queries matched")
+            
+        except Exception as e:
+            self.log_result("Search Modes", False, str(e))
+    
+    async def test_timestamp_migration(self):
+        """Test that a database with ISO-8601 text timestamps is migrated intact."""
+        try:
+            # A file in the original schema, with timestamps stored as text
+            legacy_path = os.path.join(self.test_dir, "legacy_memory.db")
+            rows = [
+                ("legacy-1", "Legacy note one", '{"project": "old"}', "2024-03-01T10:00:00.123000+00:00",
+                 "2024-03-05T08:30:00.001000+00:00", 3, 1.0, "normal"),
+                ("legacy-2", "Legacy note two", "{}", "2024-03-02T11:15:30.999000+00:00",
+                 "2024-03-07T09:45:10.500000+00:00", 0, 1.0, "normal"),
+                ("legacy-3", "Legacy note three", "{}", "2024-02-28T23:59:59+00:00",
+                 "2024-03-06T12:00:00.250000+00:00", 1, 1.0, "normal")
+            ]
+            conn = sqlite3.connect(legacy_path)
+            conn.execute("""
+                CREATE TABLE memory_nodes (
+                    id TEXT PRIMARY KEY,
+                    content TEXT NOT NULL,
+                    context TEXT,
+                    created_at TEXT NOT NULL,
+                    last_accessed_at TEXT NOT NULL,
+                    access_count INTEGER DEFAULT 0,
+                    priority_score REAL DEFAULT 1.0,
+                    node_type TEXT DEFAULT 'normal'
+                )
+            """)
+            conn.executemany("INSERT INTO memory_nodes VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.commit()
+            conn.close()
+            
+            legacy_core = MemoryCore(legacy_path)
+            try:
+                memories = await legacy_core.query_memories("Legacy note", 10)
+                nodes = await legacy_core.db.search_memories("Legacy note", 10)
+            finally:
+                await legacy_core.close()
+            
+            # Equal priorities, so the most recently accessed memory comes first
+            assert [m["id"] for m in memories] == ["legacy-2", "legacy-3", "legacy-1"], "Migration changed the ordering"
+            originals = {row[0]: row for row in rows}
+            for memory in memories:
+                assert memory["created_at"] == originals[memory["id"]][3], f"created_at changed for {memory['id']}"
+            for node in nodes:
+                original = originals[node.id]
+                assert node.last_accessed_at.isoformat() == original[4], f"last_accessed_at changed for {node.id}"
+                assert node.access_count == original[5], f"access_count changed for {node.id}"
+            
+            self.log_result("Timestamp Migration", True, f"Migrated {len(memories)} legacy memories")
+            
+        except Exception as e:
+            self.log_result("Timestamp Migration", False, str(e))
+    
+    async def test_tool_arguments_and_batches(self):
+        """Test MCP tool argument validation and per-operation batch results."""
+        try:
+            server = MCPMemoryServer(memory_core=self.memory_core)
+            
+            # Arguments are checked against the tool's input schema before it runs
+            missing = await server.call_tool_direct("query_memories", {"limit": 5})
+            assert missing.startswith("Invalid arguments for query_memories:"), f"Unexpected reply: {missing}"
+            wrong_type = await server.call_tool_direct("query_memories", {"query": "x", "limit": "five"})
+            assert wrong_type.startswith("Invalid arguments for query_memories:"), f"Unexpected reply: {wrong_type}"
+            
+            # Each operation in a batch reports its own result or error
+            memory_id = await self.memory_core.store_memory("Batch recall target", {"suite_test": "batch"})
+            reply = await server.call_tool_direct("batch_execute", {"operations": [
+                {"tool": "recall_memory", "arguments": {"memory_id": memory_id}},
+                {"tool": "no_such_tool", "arguments": {}},
+                {"tool": "recall_memory", "arguments": {}},
+                {"tool": "store_memory", "arguments": {"content": "Stored from a batch"}}
+            ]})
+            results = json.loads(reply)
+            assert [result["tool"] for result in results] == ["recall_memory", "no_such_tool", "recall_memory", "store_memory"]
+            assert "Batch recall target" in results[0]["result"], "Recall in a batch should succeed"
+            assert results[1]["error"] == "Unknown tool: no_such_tool", "Unknown tools should fail their operation"
+            assert results[2]["error"].startswith("Invalid arguments for recall_memory:"), "Bad arguments should fail their operation"
+            assert results[3]["result"].startswith("✓ Memory stored"), "Store in a batch should succeed"
+            
+            self.log_result("Tool Arguments and Batches", True, f"Batch returned {len(results)} per-operation results")
+            
+        except Exception as e:
+            self.log_result("Tool Arguments and Batches", False, str(e))
+    
     async def test_exhaustive_search(self):
         """Test comprehensive search across all memories."""
         try:
@@ -133,8 +246,10 @@ class MemoryTestSuite:
                 ("Has a cat named Whiskers", {"pet": "cat", "name": "Whiskers"})
             ]
             
-            for content, context in memories_to_store:
-                await self.memory_core.store_memory(content, context)
+            memory_ids = await self.memory_core.store_memories_batch(
+                [{"content": content, "context": context} for content, context in memories_to_store]
+            )
+            assert len(memory_ids) == len(memories_to_store), "Batch store should return one ID per memory"
             
             # Test exhaustive search
             all_memories = await self.memory_core.exhaustive_search("user", limit=50)
@@ -150,6 +265,26 @@ class MemoryTestSuite:
         except Exception as e:
             self.log_result("Exhaustive Search", False, str(e))
     
+    async def test_list_recent(self):
+        """Test listing memories without a search query."""
+        try:
+            recent = await self.memory_core.list_recent(limit=5)
+            assert 0 < len(recent) <= 5, f"Expected 1-5 recent memories, got {len(recent)}"
+            
+            # An empty query is served by the same listing
+            empty_query = await self.memory_core.query_memories("", limit=5)
+            assert [m["id"] for m in empty_query] == [m["id"] for m in recent], "Empty query should match list_recent"
+            
+            # Newest memories come first regardless of priority
+            newest = await self.memory_core.recent_memories(limit=5)
+            created = [m["created_at"] for m in newest]
+            assert created == sorted(created, reverse=True), "recent_memories should be newest first"
+            
+            self.log_result("List Recent", True, f"Listed {len(recent)} recent memories")
+            
+        except Exception as e:
+            self.log_result("List Recent", False, str(e))
+    
     async def test_amnesia_recovery_scenario(self):
         """Test the amnesia recovery scenario for AI chatbots."""
         try:
@@ -172,33 +307,34 @@ class MemoryTestSuite:
             ]
             
             # Store all memories
-            for content, context in chatbot_memories:
-                await self.memory_core.store_memory(content, context)
-            
-            # Simulate amnesia recovery: chatbot queries its memory
+            await self.memory_core.store_memories_batch(
+                [{"content": content, "context": context} for content, context in chatbot_memories]
+            )
             
-            # 1. Recover user preferences
-            preferences = await self.memory_core.search_by_context({"preference": "communication"})
+            # Simulate amnesia recovery: chatbot queries its memory. The lookups are
+            # independent, so they run at once on separate reader connections
+            preferences, learning, help_needed, appointments = await asyncio.gather(
+                # 1. Recover user preferences
+                self.memory_core.search_by_context({"preference": "communication"}),
+                # 2. Recover current learning topics
+                self.memory_core.search_by_context({"learning": "Python"}),
+                # 3. Recover areas where user needs help
+                self.memory_core.search_by_context({"needs_help": True}),
+                # 4. Recover scheduled items
+                self.memory_core.search_by_context({"type": "appointment"})
+            )
             assert len(preferences) > 0, "Should recover communication preferences"
-            
-            # 2. Recover current learning topics
-            learning = await self.memory_core.search_by_context({"learning": "Python"})
             assert len(learning) > 0, "Should recover learning context"
-            
-            # 3. Recover areas where user needs help
-            help_needed = await self.memory_core.search_by_context({"needs_help": True})
             assert len(help_needed) > 0, "Should identify areas where user needs help"
-            
-            # 4. Recover scheduled items
-            appointments = await self.memory_core.search_by_context({"type": "appointment"})
             assert len(appointments) > 0, "Should recover scheduled appointments"
             
-            # 5. Generate context for next interaction
+            # 5. Generate context for next interaction; only how much was recovered
+            # per category is reported, so the contents are not copied out
             context_summary = {
-                "user_preferences": [mem["content"] for mem in preferences],
-                "current_learning": [mem["content"] for mem in learning],
-                "help_areas": [mem["content"] for mem in help_needed],
-                "upcoming_events": [mem["content"] for mem in appointments]
+                "user_preferences": len(preferences),
+                "current_learning": len(learning),
+                "help_areas": len(help_needed),
+                "upcoming_events": len(appointments)
             }
             
             self.log_result("Amnesia Recovery Scenario", True, 
@@ -251,8 +387,9 @@ class MemoryTestSuite:
                 })
             ]
             
-            for content, context in complex_memories:
-                await self.memory_core.store_memory(content, context)
+            await self.memory_core.store_memories_batch(
+                [{"content": content, "context": context} for content, context in complex_memories]
+            )
             
             # Test searching for nested values
             project_memories = await self.memory_core.search_by_context({"project.name": "webapp"})
@@ -291,18 +428,35 @@ class MemoryTestSuite:
         print("🧠 Memory MCP Test Suite - Validating Amnesia Recovery System")
         print("=" * 60)
         
-        tests = [
+        # Open the reader connections before the concurrent tests start reading
+        await self.memory_core.warm_up()
+        
+        # These tests only check memories they stored themselves, so they run concurrently
+        isolated_tests = [
             self.test_basic_memory_storage,
             self.test_context_based_search,
             self.test_content_search,
+            self.test_search_modes,
+            self.test_timestamp_migration,
+            self.test_tool_arguments_and_batches,
             self.test_exhaustive_search,
             self.test_amnesia_recovery_scenario,
             self.test_memory_priority_and_access_patterns,
-            self.test_json_context_search_edge_cases,
+            self.test_json_context_search_edge_cases
+        ]
+        # These look at the store as a whole, so they run once the others are done
+        store_wide_tests = [
+            self.test_list_recent,
             self.test_health_and_statistics
         ]
         
-        for test in tests:
+        outcomes = await asyncio.gather(*(test() for test in isolated_tests), return_exceptions=True)
+        for test, outcome in zip(isolated_tests, outcomes):
+            # Tests log their own failures; this catches anything they let escape
+            if isinstance(outcome, Exception):
+                self.log_result(test.__name__, False, str(outcome))
+        
+        for test in store_wide_tests:
             await test()
         
         # Summary
@@ -327,7 +481,7 @@ class MemoryTestSuite:
     def cleanup(self):
         """Clean up test resources."""
         try:
-            shutil.rmtree(self.test_dir)
+            self._scratch.cleanup()
             print(f"\n🧹 Cleaned up test directory: {self.test_dir}")
         except Exception as e:
             print(f"Warning: Could not clean up test directory: {e}")
@@ -343,5 +497,11 @@ async def main():
         test_suite.cleanup()
 
 if __name__ == "__main__":
-    success = asyncio.run(main())
+    # The suite is many small awaits, which uvloop dispatches faster when it is installed
+    try:
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+    success = run(main())
     exit(0 if success else 1)
\ No newline at end of file